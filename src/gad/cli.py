@@ -1,22 +1,23 @@
 """CLI entrypoint for GAD (Good Article Digest)."""
 
+import asyncio
 import logging
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Annotated, Optional
+from typing import TYPE_CHECKING, Annotated, Optional
 
 import typer
 from rich.console import Console
-from rich.table import Table
 
-from gad.config import get_settings, load_settings, reset_settings
-from gad.dedup import compute_content_hash, compute_url_hash, is_duplicate, record_seen
-from gad.extract import extract_content
-from gad.fetch import FetchError, detect_and_parse_source, fetch_url
-from gad.models import ArticleMeta, IngestResult, SourceType
-from gad.render import create_seen_record, generate_digest, write_article
-from gad.summarize import get_summarizer
+from gad.config import Settings, get_settings
+from gad.models import IngestResult, SourceType
+
+# Pipeline modules pull in trafilatura, bs4, feedparser, httpx and openai, so
+# commands import them on demand to keep `gad --help` and `gad doctor` fast
+if TYPE_CHECKING:
+    from gad.summarize import Summarizer
 
 
 app = typer.Typer(
@@ -29,16 +30,34 @@ console = Console()
 logger = logging.getLogger(__name__)
 
 
-def setup_logging(verbose: bool = False) -> None:
-    """Configure logging based on verbosity."""
-    level = logging.DEBUG if verbose else logging.INFO
+def setup_logging(verbose: bool = False, log_level: str = "INFO") -> None:
+    """Configure logging based on verbosity and the configured log level.
+
+    This is the only place GAD configures logging; force=True replaces any
+    handlers installed earlier in the process.
+    """
+    level = logging.DEBUG if verbose else getattr(logging, log_level.upper(), logging.INFO)
     logging.basicConfig(
         level=level,
         format="%(asctime)s - %(levelname)s - %(message)s",
         handlers=[logging.StreamHandler(sys.stderr)],
+        force=True,
     )
 
 
+
+def _load_settings_with_logging(verbose: bool = False) -> Settings:
+    """Configure logging, load settings, then apply the configured log level.
+
+    Logging is set up before settings load so the config loader's own records,
+    such as which file it read, reach a handler instead of being dropped.
+    """
+    setup_logging(verbose)
+    settings = get_settings()
+    if not verbose:
+        setup_logging(log_level=settings.log_level)
+    return settings
+
 @app.command()
 def ingest(
     url: Annotated[str, typer.Argument(help="URL of the article to ingest")],
@@ -64,8 +83,11 @@ def ingest(
     Fetches the URL, extracts main text, checks for duplicates,
     summarizes with LLM, and writes files to the library.
     """
-    setup_logging(verbose)
-    settings = get_settings()
+    from gad.dedup import compute_content_hash, compute_url_hash, is_duplicate
+    from gad.extract import extract_content
+    from gad.fetch import FetchError, fetch_page
+
+    settings = _load_settings_with_logging(verbose)
     settings.ensure_directories()
 
     console.print(f"[bold blue]Ingesting:[/] {url}")
@@ -73,12 +95,13 @@ def ingest(
     try:
         # Fetch HTML
         console.print("  Fetching...", end=" ")
-        html = fetch_url(url)
+        page = fetch_page(url)
+        fetched_ts = time.time()
         console.print("[green]✓[/]")
 
         # Extract content
         console.print("  Extracting content...", end=" ")
-        extracted = extract_content(html, url)
+        extracted = extract_content(page.text, url, page.content_type)
         console.print(f"[green]✓[/] ({extracted.word_count:,} words)")
 
         if extracted.word_count < 50:
@@ -88,7 +111,9 @@ def ingest(
         url_hash = compute_url_hash(url)
         content_hash = compute_content_hash(extracted.text)
 
-        is_dup, reason = is_duplicate(url, extracted.text)
+        is_dup, reason = is_duplicate(
+            url, extracted.text, url_hash=url_hash, content_hash=content_hash
+        )
         if is_dup and not force:
             console.print(f"[yellow]Skipped:[/] {reason}")
             raise typer.Exit(0)
@@ -104,18 +129,24 @@ def ingest(
             console.print(f"  Author: {extracted.author or 'Unknown'}")
             console.print(f"  Words: {extracted.word_count:,}")
             console.print(f"  Tags: {', '.join(tags)}")
-            console.print(f"  URL Hash: {url_hash[:16]}...")
-            console.print(f"  Content Hash: {content_hash[:16]}...")
-            raise typer.Exit(0)
+            console.print(f"  URL Hash: {url_hash}")
+            console.print(f"  Content Hash: {content_hash}")
+            return
+
+        # Summarizer and writer modules are only needed past the dry-run exit
+        from gad.dedup import record_seen
+        from gad.models import ArticleMeta
+        from gad.render import create_seen_record, write_article
+        from gad.summarize import cached_summarize, get_summarizer
 
         # Generate summary
         console.print("  Summarizing...", end=" ")
         summarizer = get_summarizer()
-        summary = summarizer.summarize(extracted.text, extracted.title)
+        summary = cached_summarize(summarizer, extracted.text, extracted.title, content_hash)
         console.print("[green]✓[/]")
 
         # Create metadata
-        fetched_at = datetime.now()
+        fetched_at = datetime.fromtimestamp(fetched_ts)
         meta = ArticleMeta(
             title=extracted.title,
             author=extracted.author,
@@ -125,6 +156,7 @@ def ingest(
             content_hash=content_hash,
             fetched_at=fetched_at,
             word_count=extracted.word_count,
+            char_count=len(extracted.text),
             tags=tags,
             source=SourceType.MANUAL,
         )
@@ -148,6 +180,9 @@ def ingest(
 
         console.print(f"\n[bold green]Success![/] Article saved to: {article_dir}")
 
+    except typer.Exit:
+        # Deliberate exits (e.g. duplicate skipped) are not failures
+        raise
     except FetchError as e:
         console.print(f"[red]Error fetching URL:[/] {e}")
         raise typer.Exit(1)
@@ -177,48 +212,31 @@ def run(
     Each line in the sources file can be a direct URL or RSS feed.
     Lines starting with # are treated as comments.
     """
-    setup_logging(verbose)
-    settings = get_settings()
+    from gad.summarize import get_summarizer
+
+    settings = _load_settings_with_logging(verbose)
     settings.ensure_directories()
 
     if not sources.exists():
         console.print(f"[red]Error:[/] Sources file not found: {sources}")
         raise typer.Exit(1)
 
-    # Read sources
-    with open(sources, encoding="utf-8") as f:
-        lines = [line.strip() for line in f if line.strip() and not line.startswith("#")]
+    # Read sources: one strip per line, skipping blanks and comments
+    text = sources.read_text(encoding="utf-8")
+    lines = [s for s in map(str.strip, text.splitlines()) if s and s[0] != "#"]
 
     console.print(f"[bold blue]Processing {len(lines)} source(s)[/]")
 
-    results: list[IngestResult] = []
-
-    for source_url in lines:
-        console.print(f"\n[bold]Source:[/] {source_url}")
-
-        try:
-            # Detect if RSS feed and get article URLs
-            article_urls = detect_and_parse_source(source_url, limit=limit)
-            console.print(f"  Found {len(article_urls)} article(s)")
-
-            for article_url in article_urls:
-                result = _ingest_single(
-                    article_url,
-                    tags=list(settings.default_tags),
-                    source=SourceType.RSS if len(article_urls) > 1 else SourceType.MANUAL,
-                )
-                results.append(result)
-
-                if result.success:
-                    console.print(f"  [green]✓[/] {result.title or article_url}")
-                elif result.skipped:
-                    console.print(f"  [yellow]⊘[/] Skipped: {result.title or article_url}")
-                else:
-                    console.print(f"  [red]✗[/] {result.error or 'Unknown error'}")
-
-        except Exception as e:
-            console.print(f"  [red]Error processing source:[/] {e}")
-            logger.exception(f"Error processing source: {source_url}")
+    summarizer = get_summarizer()
+    results = asyncio.run(
+        _run_async(
+            lines,
+            limit=limit,
+            tags=list(settings.default_tags),
+            settings=settings,
+            summarizer=summarizer,
+        )
+    )
 
     # Print summary
     success_count = sum(1 for r in results if r.success)
@@ -231,83 +249,52 @@ def run(
     console.print(f"  Errors: {error_count}")
 
 
-def _ingest_single(url: str, tags: list[str], source: SourceType) -> IngestResult:
-    """Ingest a single URL, returning result without raising exceptions."""
-    settings = get_settings()
-
-    try:
-        # Fetch
-        html = fetch_url(url)
-
-        # Extract
-        extracted = extract_content(html, url)
-
-        if extracted.word_count < 50:
-            return IngestResult(
-                url=url,
-                success=False,
-                error="Too little content extracted",
-            )
+async def _run_async(
+    lines: list[str],
+    limit: Optional[int],
+    tags: list[str],
+    *,
+    settings: Settings,
+    summarizer: "Summarizer",
+) -> list[IngestResult]:
+    """Resolve all sources, then ingest every article through the staged pipeline."""
+    from gad.fetch import detect_and_parse_source
+    from gad.pipeline import run_pipeline
 
-        # Check duplicates
-        url_hash = compute_url_hash(url)
-        content_hash = compute_content_hash(extracted.text)
+    async def resolve(source_url: str) -> list[str]:
+        return await asyncio.to_thread(detect_and_parse_source, source_url, limit=limit)
 
-        is_dup, reason = is_duplicate(url, extracted.text)
-        if is_dup:
-            return IngestResult(
-                url=url,
-                success=False,
-                skipped=True,
-                title=extracted.title,
-            )
+    # Detect feeds and collect article URLs from every source
+    resolved = await asyncio.gather(*(resolve(u) for u in lines), return_exceptions=True)
 
-        # Summarize
-        summarizer = get_summarizer()
-        summary = summarizer.summarize(extracted.text, extracted.title)
+    jobs: list[tuple[str, SourceType]] = []
+    for source_url, article_urls in zip(lines, resolved):
+        console.print(f"\n[bold]Source:[/] {source_url}")
+        if isinstance(article_urls, BaseException):
+            console.print(f"  [red]Error processing source:[/] {article_urls}")
+            logger.error(f"Error processing source: {source_url}", exc_info=article_urls)
+            continue
 
-        # Create metadata
-        fetched_at = datetime.now()
-        meta = ArticleMeta(
-            title=extracted.title,
-            author=extracted.author,
-            published_date=extracted.published_date,
-            url=url,
-            url_hash=url_hash,
-            content_hash=content_hash,
-            fetched_at=fetched_at,
-            word_count=extracted.word_count,
-            tags=tags,
-            source=source,
-        )
+        console.print(f"  Found {len(article_urls)} article(s)")
+        source = SourceType.RSS if len(article_urls) > 1 else SourceType.MANUAL
+        jobs.extend((article_url, source) for article_url in article_urls)
 
-        # Write
-        article_dir = write_article(meta, extracted.text, summary)
+    if jobs:
+        console.print(f"\n[bold blue]Ingesting {len(jobs)} article(s)[/]")
 
-        # Record seen
-        seen_record = create_seen_record(
-            url=url,
-            url_hash=url_hash,
-            content_hash=content_hash,
-            title=extracted.title,
-            stored_path=article_dir,
-            source=source,
-            fetched_at=fetched_at,
-        )
-        record_seen(seen_record)
+    return await run_pipeline(
+        jobs, tags, settings=settings, summarizer=summarizer, on_result=_print_result
+    )
 
-        return IngestResult(
-            url=url,
-            success=True,
-            title=extracted.title,
-            stored_path=str(article_dir),
-        )
 
-    except FetchError as e:
-        return IngestResult(url=url, success=False, error=str(e))
-    except Exception as e:
-        logger.exception(f"Error ingesting {url}")
-        return IngestResult(url=url, success=False, error=str(e))
+def _print_result(result: IngestResult) -> None:
+    """Print a one-line status for an ingested article."""
+    if result.success:
+        console.print(f"  [green]✓[/] {result.title or result.url}")
+    elif result.skipped:
+        console.print(f"  [yellow]⊘[/] Skipped: {result.title or result.url}")
+    else:
+        console.print(f"  [red]✗[/] {result.error or 'Unknown error'}")
 
 
 @app.command()
@@ -325,8 +312,9 @@ def digest(
 
     Creates a Markdown file listing all articles ingested on the specified date.
     """
-    setup_logging(verbose)
-    settings = get_settings()
+    from gad.render import generate_digest
+
+    settings = _load_settings_with_logging(verbose)
     settings.ensure_directories()
 
     if date:
@@ -349,6 +337,26 @@ def digest(
         raise typer.Exit(1)
 
 
+@app.command("migrate-library")
+def migrate_library(
+    verbose: Annotated[
+        bool,
+        typer.Option("--verbose", "-v", help="Enable verbose output"),
+    ] = False,
+) -> None:
+    """Move articles from the old month layout into per-day directories.
+
+    Articles are stored under library/<YYYY>/<MM>/<DD>/. Run once to move
+    articles saved by earlier versions under library/<YYYY>/<MM>/.
+    """
+    from gad.render import migrate_library_layout
+
+    settings = _load_settings_with_logging(verbose)
+
+    moved = migrate_library_layout(settings.library_dir)
+    console.print(f"[bold green]Migrated {moved} articles[/] in {settings.library_dir}")
+
+
 @app.command()
 def doctor(
     verbose: Annotated[
@@ -360,8 +368,11 @@ def doctor(
 
     Verifies that GAD is properly configured and ready to use.
     """
+    from rich.table import Table
+
+    from gad.config import find_config_file, load_settings
+
     setup_logging(verbose)
-    reset_settings()  # Force reload
 
     console.print("[bold blue]GAD Doctor[/]\n")
 
@@ -381,8 +392,6 @@ def doctor(
         all_ok = False
 
     # Check config file
-    from gad.config import find_config_file
-
     config_path = find_config_file()
     if config_path:
         table.add_row("Config File", "✓", str(config_path))
@@ -488,13 +497,12 @@ def digest_json(
     1. Pre-rank items locally (source weight, freshness, content length).
     2. Send Top-K to LLM for scoring, grouping, and copywriting.
     """
-    import json as _json
+    import orjson
 
     from gad.digest import generate_digest_json, pre_rank
     from gad.models import DigestItemInput
 
-    setup_logging(verbose)
-    settings = get_settings()
+    settings = _load_settings_with_logging(verbose)
     settings.ensure_directories()
 
     # --- Collect items ---
@@ -504,7 +512,7 @@ def digest_json(
         if not input_file.exists():
             console.print(f"[red]Error:[/] Input file not found: {input_file}")
             raise typer.Exit(1)
-        raw = _json.loads(input_file.read_text(encoding="utf-8"))
+        raw = orjson.loads(input_file.read_bytes())
         if isinstance(raw, list):
             items = [DigestItemInput.model_validate(r) for r in raw]
         else:
@@ -523,16 +531,17 @@ def digest_json(
         from gad.render import load_articles_for_date
 
         articles = load_articles_for_date(target_date)
+        # Every loaded article was fetched on target_date
+        fetched_date = target_date.strftime("%Y-%m-%d")
         for meta, article_dir in articles:
-            content_path = article_dir / "content.txt"
-            content = content_path.read_text(encoding="utf-8") if content_path.exists() else None
             items.append(
-                DigestItemInput(
+                DigestItemInput.with_lazy_content(
+                    article_dir / "content.txt",
+                    meta.char_count,
                     title=meta.title,
                     url=meta.url,
                     source=meta.source.value,
-                    date=meta.published_date or meta.fetched_at.strftime("%Y-%m-%d"),
-                    content=content,
+                    date=meta.published_date or fetched_date,
                     author=meta.author,
                     tags=meta.tags,
                 )
@@ -565,9 +574,8 @@ def digest_json(
     out_dir = output or (settings.output_dir / "web")
     out_dir.mkdir(parents=True, exist_ok=True)
     out_path = out_dir / "digest.json"
-    out_path.write_text(
-        digest_output.model_dump_json(indent=2, ensure_ascii=False),
-        encoding="utf-8",
+    out_path.write_bytes(
+        orjson.dumps(digest_output.model_dump(mode="json"), option=orjson.OPT_INDENT_2)
     )
     console.print(f"\n[bold green]Digest written to:[/] {out_path}")
     console.print(
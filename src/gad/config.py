@@ -1,5 +1,7 @@
 """Configuration management for GAD."""
 
+import copy
+import functools
 import logging
 import os
 from pathlib import Path
@@ -12,6 +14,12 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 logger = logging.getLogger(__name__)
 
+# Prefer libyaml's C loader; PyYAML built without libyaml only has the pure-Python one
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Result of find_config_file per working directory, cleared by reset_settings
+_CONFIG_PATH_CACHE: dict[str, Optional[Path]] = {}
+
 
 class HttpConfig(BaseModel):
     """HTTP request configuration."""
@@ -43,6 +51,15 @@ class Settings(BaseSettings):
         default_factory=lambda: ["reading-list"], description="Default tags for articles"
     )
     log_level: str = Field(default="INFO", description="Logging level")
+    max_concurrency: int = Field(
+        default=8, ge=1, description="Max concurrent article fetches in `gad run`"
+    )
+    extract_workers: Optional[int] = Field(
+        default=None, ge=1, description="Extraction processes in `gad run` (default: CPU count)"
+    )
+    llm_concurrency: int = Field(
+        default=4, ge=1, description="Max concurrent summarization requests in `gad run`"
+    )
 
     # HTTP settings
     http: HttpConfig = Field(default_factory=HttpConfig)
@@ -65,6 +82,11 @@ class Settings(BaseSettings):
         """Get the daily digest directory path."""
         return self.output_dir / "daily_digest"
 
+    @property
+    def cache_dir(self) -> Path:
+        """Get the cache directory path."""
+        return self.output_dir / "cache"
+
     @property
     def seen_file(self) -> Path:
         """Get the seen.jsonl file path."""
@@ -79,6 +101,14 @@ class Settings(BaseSettings):
 
 def find_config_file() -> Optional[Path]:
     """Find the configuration file in standard locations."""
+    cwd = os.getcwd()
+    if cwd not in _CONFIG_PATH_CACHE:
+        _CONFIG_PATH_CACHE[cwd] = _search_config_file()
+    return _CONFIG_PATH_CACHE[cwd]
+
+
+def _search_config_file() -> Optional[Path]:
+    """Return the first existing configuration file, if any."""
     search_paths = [
         Path("configs/settings.yaml"),
         Path("configs/settings.yml"),
@@ -94,20 +124,29 @@ def find_config_file() -> Optional[Path]:
     return None
 
 
+@functools.lru_cache(maxsize=4)
+def _parse_yaml(path_str: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse a YAML file; cached by path and modification time."""
+    logger.info(f"Loading config from {path_str}")
+    config = yaml.load(Path(path_str).read_bytes(), Loader=_YamlLoader)
+    return config or {}
+
+
 def load_yaml_config(config_path: Optional[Path] = None) -> dict[str, Any]:
     """Load configuration from YAML file."""
     if config_path is None:
         config_path = find_config_file()
 
-    if config_path is None or not config_path.exists():
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns if config_path is not None else None
+    except FileNotFoundError:
+        mtime_ns = None
+    if config_path is None or mtime_ns is None:
         logger.debug("No config file found, using defaults")
         return {}
 
-    logger.info(f"Loading config from {config_path}")
-    with open(config_path, encoding="utf-8") as f:
-        config = yaml.safe_load(f)
-
-    return config or {}
+    # Callers may modify the result, so never hand out the cached dict itself
+    return copy.deepcopy(_parse_yaml(str(config_path), mtime_ns))
 
 
 def load_settings(config_path: Optional[Path] = None) -> Settings:
@@ -128,15 +167,7 @@ def load_settings(config_path: Optional[Path] = None) -> Settings:
     if os.environ.get("OPENAI_API_KEY"):
         yaml_config["openai_api_key"] = os.environ["OPENAI_API_KEY"]
 
-    settings = Settings(**yaml_config)
-
-    # Configure logging based on settings
-    logging.basicConfig(
-        level=getattr(logging, settings.log_level.upper(), logging.INFO),
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    )
-
-    return settings
+    return Settings(**yaml_config)
 
 
 # Global settings instance (lazy loaded)
@@ -155,3 +186,4 @@ def reset_settings() -> None:
     """Reset the global settings instance (for testing)."""
     global _settings
     _settings = None
+    _CONFIG_PATH_CACHE.clear()
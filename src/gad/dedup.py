@@ -1,12 +1,19 @@
 """Deduplication logic for GAD."""
 
 import hashlib
-import json
 import logging
+import math
+import mmap
+import os
 import re
+import struct
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
-from urllib.parse import urlparse, urlunparse
+from typing import AbstractSet, Any, BinaryIO, Callable, Iterator, Optional, Union
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+import orjson
 
 from gad.config import get_settings
 from gad.models import SeenRecord
@@ -15,6 +22,155 @@ from gad.models import SeenRecord
 logger = logging.getLogger(__name__)
 
 
+class BloomFilter:
+    """Probabilistic set of hash strings with no false negatives.
+
+    Bit positions come from the first 64 bits of the (hex) key via double
+    hashing, so seen hashes need no further hashing. Non-hex keys are
+    digested with BLAKE2b first.
+    """
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 1e-5) -> None:
+        """Size the filter for the expected number of keys.
+
+        Args:
+            capacity: Number of keys the filter is sized for.
+            error_rate: Target false positive rate at capacity.
+        """
+        self.capacity = capacity
+        self.count = 0
+        self.num_bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    @classmethod
+    def from_bits(
+        cls, num_bits: int, num_hashes: int, bits: bytes, *, capacity: int, count: int
+    ) -> "BloomFilter":
+        """Restore a filter from its parameters and bit array.
+
+        Args:
+            num_bits: Size of the bit array in bits.
+            num_hashes: Number of bit positions per key.
+            bits: The bit array, as returned by to_bytes().
+            capacity: Number of keys the filter was sized for.
+            count: Number of keys added so far.
+
+        Returns:
+            The restored filter.
+        """
+        if len(bits) != (num_bits + 7) // 8:
+            raise ValueError("bit array does not match num_bits")
+        bloom = cls.__new__(cls)
+        bloom.capacity = capacity
+        bloom.count = count
+        bloom.num_bits = num_bits
+        bloom.num_hashes = num_hashes
+        bloom._bits = bytearray(bits)
+        return bloom
+
+    @property
+    def is_full(self) -> bool:
+        """Whether more keys were added than the filter was sized for."""
+        return self.count > self.capacity
+
+    def to_bytes(self) -> bytes:
+        """Return a copy of the bit array."""
+        return bytes(self._bits)
+
+    def _positions(self, key: str) -> list[int]:
+        try:
+            value = int(key[:16], 16)
+        except ValueError:
+            digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+            value = int.from_bytes(digest, "big")
+        h1, h2 = value >> 32, (value & 0xFFFFFFFF) | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, key: str) -> None:
+        """Add a key to the filter."""
+        self.count += 1
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+@dataclass
+class SeenIndex:
+    """Seen records indexed by URL hash and by content hash.
+
+    Records are kept as the decoded JSON objects: duplicate checks only read
+    the hashes and title, so SeenRecord validation is deferred to
+    load_seen_records.
+    """
+
+    by_url: dict[str, dict[str, Any]] = field(default_factory=dict)
+    by_content: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    def add(self, record: dict[str, Any]) -> None:
+        """Index a record; the first record with a given content hash wins.
+
+        Legacy full-length hashes are indexed by their 64-bit prefix.
+        """
+        self.by_url[record["url_hash"][:_HASH_HEX_LEN]] = record
+        self.by_content.setdefault(record["content_hash"][:_HASH_HEX_LEN], record)
+
+
+# Hex characters kept from each SHA256 digest (its first 64 bits). Older seen
+# files hold full 64-character digests; they are truncated when indexed.
+_HASH_HEX_LEN = 16
+
+# Bloom filters of seen hashes, keyed by seen file and tagged with the file's
+# (mtime_ns, size) so external edits trigger a rebuild
+_BLOOMS: dict[Path, tuple[Optional[tuple[int, int]], BloomFilter]] = {}
+
+# Parsed seen records per seen file, tagged like _BLOOMS
+_SEEN_CACHE: dict[Path, tuple[Optional[tuple[int, int]], SeenIndex]] = {}
+
+# URLs that normalize_url would return unchanged: lowercase http(s) scheme and
+# host without port, no query, params or fragment, and no trailing slash
+# except for the root path. Whitespace and control characters are excluded
+# because urlparse strips or removes them.
+_CANONICAL_URL_RE = re.compile(
+    r"https?://[a-z0-9.-]+(?:/|/[^?#;\x00-\x20]*[^/?#;\x00-\x20])?"
+)
+
+# Query parameters dropped by normalize_url
+_TRACKING_PARAMS = frozenset(
+    {
+        "utm_source",
+        "utm_medium",
+        "utm_campaign",
+        "utm_term",
+        "utm_content",
+        "ref",
+        "source",
+        "fbclid",
+        "gclid",
+    }
+)
+
+# Hash fields as they appear in raw seen.jsonl lines
+_SEEN_HASH_RE = re.compile(rb'"(?:url_hash|content_hash)"\s*:\s*"([^"]*)"')
+
+# seen.idx header: magic, bytes of seen.jsonl covered, num_bits, num_hashes,
+# capacity and count of keys added, and a digest of the covered file's last
+# bytes, followed by the Bloom bit array
+_BLOOM_INDEX_HEADER = struct.Struct("<8sQQIQQ16s")
+_BLOOM_INDEX_MAGIC = b"GADBLM2\x00"
+_BLOOM_INDEX_CHECK_BYTES = 256
+
+# Bloom filters are sized for this many times the keys in seen.jsonl, and at
+# least _BLOOM_MIN_CAPACITY keys, so they hold a good run of appends before a
+# rebuild at a larger size
+_BLOOM_HEADROOM = 2
+_BLOOM_MIN_CAPACITY = 4096
+
+
 def normalize_url(url: str) -> str:
     """Normalize a URL for consistent hashing.
 
@@ -31,6 +187,10 @@ def normalize_url(url: str) -> str:
     Returns:
         Normalized URL string.
     """
+    # Already-canonical URLs (typical of feed links) skip parsing entirely
+    if _CANONICAL_URL_RE.fullmatch(url):
+        return url
+
     parsed = urlparse(url)
 
     # Lowercase scheme and host
@@ -49,27 +209,14 @@ def normalize_url(url: str) -> str:
         path = path.rstrip("/")
 
     # Sort query parameters and remove tracking params
-    tracking_params = {
-        "utm_source",
-        "utm_medium",
-        "utm_campaign",
-        "utm_term",
-        "utm_content",
-        "ref",
-        "source",
-        "fbclid",
-        "gclid",
-    }
-
-    query_parts = []
+    query = ""
     if parsed.query:
-        for param in sorted(parsed.query.split("&")):
-            if "=" in param:
-                key = param.split("=")[0]
-                if key.lower() not in tracking_params:
-                    query_parts.append(param)
-
-    query = "&".join(query_parts)
+        pairs = [
+            (key, value)
+            for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+            if key.lower() not in _TRACKING_PARAMS
+        ]
+        query = urlencode(sorted(pairs))
 
     # Reconstruct URL without fragment
     normalized = urlunparse((scheme, netloc, path, "", query, ""))
@@ -86,44 +233,43 @@ def normalize_text(text: str) -> str:
     Returns:
         Normalized text string.
     """
-    # Lowercase
-    text = text.lower()
-    # Remove extra whitespace
-    text = re.sub(r"\s+", " ", text)
-    # Strip
-    text = text.strip()
-    return text
+    # Lowercase, then collapse and strip whitespace; split() matches the same
+    # characters as the regex \s, so content hashes are unchanged
+    return " ".join(text.lower().split())
 
 
 def compute_url_hash(url: str) -> str:
-    """Compute SHA256 hash of normalized URL.
+    """Compute the 64-bit SHA256 prefix of the normalized URL.
 
     Args:
         url: The URL to hash.
 
     Returns:
-        Hex digest of the hash.
+        First 8 bytes of the digest as 16 hex characters.
     """
     normalized = normalize_url(url)
-    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+    return hashlib.sha256(normalized.encode("utf-8")).digest()[:8].hex()
 
 
 def compute_content_hash(text: str) -> str:
-    """Compute SHA256 hash of normalized content.
+    """Compute the 64-bit SHA256 prefix of the normalized content.
 
     Args:
         text: The text content to hash.
 
     Returns:
-        Hex digest of the hash.
+        First 8 bytes of the digest as 16 hex characters.
     """
     normalized = normalize_text(text)
-    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+    return hashlib.sha256(normalized.encode("utf-8")).digest()[:8].hex()
 
 
 def load_seen_records(seen_file: Optional[Path] = None) -> dict[str, SeenRecord]:
     """Load all seen records from the JSONL file.
 
+    The parsed records are cached per file and reused until the file's size
+    or modification time changes.
+
     Args:
         seen_file: Path to seen.jsonl file, uses config default if None.
 
@@ -135,46 +281,256 @@ def load_seen_records(seen_file: Optional[Path] = None) -> dict[str, SeenRecord]
         seen_file = settings.seen_file
 
     records: dict[str, SeenRecord] = {}
+    for url_hash, data in _get_seen_index(seen_file).by_url.items():
+        try:
+            records[url_hash] = SeenRecord.model_validate(data)
+        except ValueError as e:
+            logger.warning(f"Invalid seen record {url_hash}: {e}")
+    return records
 
-    if not seen_file.exists():
-        return records
+
+def _get_seen_index(seen_file: Path) -> SeenIndex:
+    """Get the cached index of seen_file, re-parsing it if the file changed.
+
+    The returned index is shared; callers must not modify it.
+    """
+    # Stat before reading: a concurrent append then forces a re-parse next time
+    signature = _file_signature(seen_file)
+    cached = _SEEN_CACHE.get(seen_file)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    index = SeenIndex()
+    if signature is not None:
+        for record in _parse_seen_file(seen_file).values():
+            index.add(record)
+    _SEEN_CACHE[seen_file] = (signature, index)
+    return index
+
+
+def _parse_seen_file(seen_file: Path) -> dict[str, dict[str, Any]]:
+    """Parse every record in seen_file into its JSON object, keyed by URL hash."""
+    records: dict[str, dict[str, Any]] = {}
 
     try:
-        with open(seen_file, encoding="utf-8") as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    data = json.loads(line)
-                    record = SeenRecord.model_validate(data)
-                    records[record.url_hash] = record
-                except (json.JSONDecodeError, ValueError) as e:
-                    logger.warning(f"Invalid record at line {line_num}: {e}")
+        # One read for the whole file; lines are split from the bytes
+        lines = seen_file.read_bytes().splitlines()
+    except FileNotFoundError:
+        return records
     except OSError as e:
         logger.error(f"Error reading seen file: {e}")
+        return records
+
+    for line_num, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            # Decode only; full validation would dominate for large files
+            record = orjson.loads(line)
+            if not isinstance(record["url_hash"], str) or not isinstance(
+                record["content_hash"], str
+            ):
+                raise ValueError("hashes must be strings")
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Invalid record at line {line_num}: {e!r}")
+            continue
+        records[record["url_hash"][:_HASH_HEX_LEN]] = record
 
     logger.debug(f"Loaded {len(records)} seen records")
     return records
 
 
-def get_content_hashes(seen_file: Optional[Path] = None) -> set[str]:
+def get_content_hashes(seen_file: Optional[Path] = None) -> AbstractSet[str]:
     """Get all content hashes from seen records.
 
     Args:
         seen_file: Path to seen.jsonl file, uses config default if None.
 
     Returns:
-        Set of content hashes.
+        Read-only set view of content hashes, backed by the cached index
+        without copying it.
     """
-    records = load_seen_records(seen_file)
-    return {r.content_hash for r in records.values()}
+    if seen_file is None:
+        seen_file = get_settings().seen_file
+    return _get_seen_index(seen_file).by_content.keys()
+
+
+def _file_signature(path: Path) -> Optional[tuple[int, int]]:
+    """Return (mtime_ns, size) for a file, or None if it does not exist."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+@contextmanager
+def _map_seen_file(seen_file: Path) -> Iterator[Union[mmap.mmap, bytes]]:
+    """Memory-map seen_file read-only, yielding empty bytes if it is missing or empty."""
+    try:
+        f = open(seen_file, "rb")
+    except FileNotFoundError:
+        yield b""
+        return
+    with f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def _scan_seen_hashes(seen_file: Path, start: int = 0) -> tuple[list[str], int, bytes]:
+    """Find every url_hash and content_hash in seen_file without decoding JSON.
+
+    Only complete lines are scanned, so a line being appended concurrently is
+    picked up whole by a later scan.
+
+    Args:
+        seen_file: Path to seen.jsonl.
+        start: Byte offset of the first line to scan.
+
+    Returns:
+        Tuple of (hashes, end offset of the last complete line, digest of the
+        bytes just before that offset).
+    """
+    try:
+        with _map_seen_file(seen_file) as data:
+            end = data.rfind(b"\n") + 1
+            if end <= start:
+                return [], start, _covered_digest(data, start)
+            hashes = [
+                h.decode("ascii", "replace") for h in _SEEN_HASH_RE.findall(data, start, end)
+            ]
+            return hashes, end, _covered_digest(data, end)
+    except OSError as e:
+        logger.error(f"Error reading seen file: {e}")
+        return [], start, b""
+
+
+def _covered_digest(data: Union[mmap.mmap, bytes], covered: int) -> bytes:
+    """Digest the bytes just before covered, to detect a rewritten seen file."""
+    tail = data[max(0, covered - _BLOOM_INDEX_CHECK_BYTES) : covered]
+    return hashlib.blake2b(tail, digest_size=16).digest()
+
+
+def _bloom_index_file(seen_file: Path) -> Path:
+    """Get the path of the persisted Bloom filter for seen_file (seen.idx)."""
+    return seen_file.with_suffix(".idx")
+
+
+def _load_bloom_index(seen_file: Path) -> Optional[tuple[BloomFilter, int]]:
+    """Load the persisted Bloom filter if it still matches seen_file.
+
+    Returns:
+        Tuple of (filter, bytes of seen_file it covers), or None if the index is
+        missing, unreadable, or seen_file was truncated or rewritten.
+    """
+    try:
+        raw = _bloom_index_file(seen_file).read_bytes()
+        magic, covered, num_bits, num_hashes, capacity, count, check = (
+            _BLOOM_INDEX_HEADER.unpack_from(raw)
+        )
+        if magic != _BLOOM_INDEX_MAGIC:
+            return None
+        bloom = BloomFilter.from_bits(
+            num_bits,
+            num_hashes,
+            raw[_BLOOM_INDEX_HEADER.size :],
+            capacity=capacity,
+            count=count,
+        )
+        with _map_seen_file(seen_file) as data:
+            if len(data) < covered or _covered_digest(data, covered) != check:
+                return None
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, struct.error) as e:
+        logger.warning(f"Ignoring unreadable seen index: {e}")
+        return None
+    return bloom, covered
+
+
+def _save_bloom_index(seen_file: Path, bloom: BloomFilter, covered: int, check: bytes) -> None:
+    """Persist the Bloom filter so the next process only scans newer lines."""
+    index_file = _bloom_index_file(seen_file)
+    header = _BLOOM_INDEX_HEADER.pack(
+        _BLOOM_INDEX_MAGIC,
+        covered,
+        bloom.num_bits,
+        bloom.num_hashes,
+        bloom.capacity,
+        bloom.count,
+        check,
+    )
+    try:
+        tmp_file = index_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_bytes(header + bloom.to_bytes())
+        os.replace(tmp_file, index_file)
+    except OSError as e:
+        logger.warning(f"Could not write seen index: {e}")
+
+
+def _get_bloom(seen_file: Path) -> BloomFilter:
+    """Get the Bloom filter of hashes in seen_file, rebuilding it if the file changed.
+
+    The filter is persisted next to seen_file as seen.idx. A new process
+    restores it and only scans lines appended since it was saved. Filters are
+    sized from the number of seen hashes and rebuilt larger once they fill up.
+    """
+    signature = _file_signature(seen_file)
+    cached = _BLOOMS.get(seen_file)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    bloom = _new_bloom(0)
+    if signature is not None:
+        loaded = _load_bloom_index(seen_file)
+        if loaded is not None:
+            bloom, covered = loaded
+            hashes, end, check = _scan_seen_hashes(seen_file, covered)
+            if bloom.count + len(hashes) > bloom.capacity:
+                loaded = None
+        if loaded is None:
+            covered = 0
+            hashes, end, check = _scan_seen_hashes(seen_file)
+            bloom = _new_bloom(len(hashes))
+        for seen_hash in hashes:
+            bloom.add(seen_hash)
+        if end != covered:
+            _save_bloom_index(seen_file, bloom, end, check)
+    _BLOOMS[seen_file] = (signature, bloom)
+    return bloom
+
+
+def _new_bloom(num_keys: int) -> BloomFilter:
+    """Create an empty Bloom filter with headroom for num_keys seen hashes."""
+    return BloomFilter(capacity=max(_BLOOM_MIN_CAPACITY, _BLOOM_HEADROOM * num_keys))
+
+
+def preload_seen(seen_file: Optional[Path] = None) -> None:
+    """Build the cached Bloom filter and record index for seen_file.
+
+    The first duplicate check against a file scans and parses it; callers on
+    an event loop can run this on a worker thread first so later is_duplicate
+    calls only do lookups.
+
+    Args:
+        seen_file: Path to seen.jsonl file, uses config default if None.
+    """
+    if seen_file is None:
+        seen_file = get_settings().seen_file
+    _get_bloom(seen_file)
+    _get_seen_index(seen_file)
 
 
 def is_duplicate(
     url: str,
     content: Optional[str] = None,
     seen_file: Optional[Path] = None,
+    *,
+    url_hash: Optional[str] = None,
+    content_hash: Optional[str] = None,
 ) -> tuple[bool, Optional[str]]:
     """Check if a URL or content is a duplicate.
 
@@ -182,31 +538,90 @@ def is_duplicate(
         url: The URL to check.
         content: Optional content text to check.
         seen_file: Path to seen.jsonl file, uses config default if None.
+        url_hash: Precomputed hash of url, computed if None.
+        content_hash: Precomputed hash of content, computed if None.
 
     Returns:
         Tuple of (is_duplicate, reason).
         Reason is None if not duplicate, otherwise describes why.
     """
-    url_hash = compute_url_hash(url)
-    records = load_seen_records(seen_file)
+    if seen_file is None:
+        settings = get_settings()
+        seen_file = settings.seen_file
+
+    if url_hash is None:
+        url_hash = compute_url_hash(url)
+    else:
+        url_hash = url_hash[:_HASH_HEX_LEN]
+    if content_hash is None and content:
+        content_hash = compute_content_hash(content)
+    elif content_hash is not None:
+        content_hash = content_hash[:_HASH_HEX_LEN]
+
+    # Bloom filter has no false negatives: a miss means definitely not seen
+    bloom = _get_bloom(seen_file)
+    if url_hash not in bloom and (content_hash is None or content_hash not in bloom):
+        return False, None
+
+    index = _get_seen_index(seen_file)
 
     # Check URL hash
-    if url_hash in records:
-        return True, f"URL already seen: {records[url_hash].title}"
+    record = index.by_url.get(url_hash)
+    if record is not None:
+        return True, f"URL already seen: {record.get('title')}"
 
     # Check content hash if provided
-    if content:
-        content_hash = compute_content_hash(content)
-        content_hashes = {r.content_hash for r in records.values()}
-        if content_hash in content_hashes:
-            # Find the matching record
-            for record in records.values():
-                if record.content_hash == content_hash:
-                    return True, f"Content matches existing: {record.title}"
+    if content_hash is not None:
+        record = index.by_content.get(content_hash)
+        if record is not None:
+            return True, f"Content matches existing: {record.get('title')}"
 
     return False, None
 
 
+def _append_seen(record: SeenRecord, seen_file: Path, write: Callable[[bytes], None]) -> None:
+    """Append a record via write, keeping the cached Bloom filter and records in sync.
+
+    write must leave the line on disk (flushed) when it returns.
+    """
+    # Only extend cached state that reflects the file as it is now
+    signature = _file_signature(seen_file)
+    cached_bloom = _BLOOMS.get(seen_file)
+    cached_index = _SEEN_CACHE.get(seen_file)
+
+    try:
+        line = record.model_dump_jsonl()
+        write(line)
+        logger.debug(f"Recorded seen: {record.title}")
+    except OSError as e:
+        logger.error(f"Error writing to seen file: {e}")
+        _BLOOMS.pop(seen_file, None)
+        _SEEN_CACHE.pop(seen_file, None)
+        raise
+
+    new_signature = _file_signature(seen_file)
+
+    if cached_bloom is not None and cached_bloom[0] == signature:
+        bloom = cached_bloom[1]
+        bloom.add(record.url_hash)
+        bloom.add(record.content_hash)
+        # A full filter is dropped so the next check rebuilds it at a larger size
+        if bloom.is_full:
+            _BLOOMS.pop(seen_file, None)
+        else:
+            _BLOOMS[seen_file] = (new_signature, bloom)
+    else:
+        _BLOOMS.pop(seen_file, None)
+
+    if cached_index is not None and cached_index[0] == signature:
+        index = cached_index[1]
+        # Index the same decoded form a re-parse of the file would produce
+        index.add(orjson.loads(line))
+        _SEEN_CACHE[seen_file] = (new_signature, index)
+    else:
+        _SEEN_CACHE.pop(seen_file, None)
+
+
 def record_seen(record: SeenRecord, seen_file: Optional[Path] = None) -> None:
     """Append a record to the seen.jsonl file.
 
@@ -221,10 +636,54 @@ def record_seen(record: SeenRecord, seen_file: Optional[Path] = None) -> None:
     # Ensure parent directory exists
     seen_file.parent.mkdir(parents=True, exist_ok=True)
 
-    try:
-        with open(seen_file, "a", encoding="utf-8") as f:
-            f.write(record.model_dump_json() + "\n")
-        logger.debug(f"Recorded seen: {record.title}")
-    except OSError as e:
-        logger.error(f"Error writing to seen file: {e}")
-        raise
+    def write(line: bytes) -> None:
+        with open(seen_file, "ab") as f:
+            f.write(line)
+
+    _append_seen(record, seen_file, write)
+
+
+class SeenWriter:
+    """Appends records to seen.jsonl through a single open file.
+
+    Use for batches: the file is opened on the first write and kept open
+    until close(), instead of being reopened for every record. Each record
+    is flushed as it is written, so duplicate checks and crash recovery see
+    the same file as with record_seen.
+    """
+
+    def __init__(self, seen_file: Optional[Path] = None) -> None:
+        """Create a writer for seen_file.
+
+        Args:
+            seen_file: Path to seen.jsonl file, uses config default if None.
+        """
+        if seen_file is None:
+            seen_file = get_settings().seen_file
+        self.seen_file = seen_file
+        self._file: Optional[BinaryIO] = None
+
+    def write(self, record: SeenRecord) -> None:
+        """Append a record to the seen file."""
+        if self._file is None:
+            self.seen_file.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.seen_file, "ab")
+        f = self._file
+
+        def write(line: bytes) -> None:
+            f.write(line)
+            f.flush()
+
+        _append_seen(record, self.seen_file, write)
+
+    def close(self) -> None:
+        """Close the underlying file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "SeenWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
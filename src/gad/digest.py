@@ -4,7 +4,9 @@ Step 1 — pre_rank: score items locally (source weight, freshness, content leng
 Step 2 — generate_digest_json: send Top-K to LLM, validate, cache result
 """
 
+import functools
 import hashlib
+import heapq
 import json
 import logging
 import re
@@ -12,11 +14,26 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+import orjson
+from pydantic import TypeAdapter
+
 from gad.config import get_settings
 from gad.models import DigestItemInput, DigestOutput
 
 logger = logging.getLogger(__name__)
 
+# Serializes the pre-ranked items in one pydantic-core call
+_ITEMS_ADAPTER = TypeAdapter(list[DigestItemInput])
+
+# NumPy is optional; pre_rank falls back to pure Python without it
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    np = None  # type: ignore
+    HAS_NUMPY = False
+
 # ---------------------------------------------------------------------------
 # Source weight table (higher = more authoritative)
 # ---------------------------------------------------------------------------
@@ -43,8 +60,19 @@ _SOURCE_WEIGHTS: dict[str, int] = {
 }
 
 
+# Host part of an absolute URL (userinfo and port excluded)
+_HOST_RE = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*://(?:[^@/?#]*@)?([^:/?#]*)")
+
+
 def _source_weight(item: DigestItemInput) -> int:
     """Return a 1-5 weight for the item's source domain."""
+    # The site's own domain label decides when it is a known source
+    match = _HOST_RE.match(item.url)
+    if match:
+        weight = _host_weight(match.group(1).lower())
+        if weight is not None:
+            return weight
+
     src = (item.source or "").lower()
     url = item.url.lower()
     for key, weight in _SOURCE_WEIGHTS.items():
@@ -53,38 +81,53 @@ def _source_weight(item: DigestItemInput) -> int:
     return 2  # unknown source gets a neutral score
 
 
-def _freshness_score(item: DigestItemInput) -> float:
-    """0-5 score based on how recent the date is."""
+@functools.lru_cache(maxsize=1024)
+def _host_weight(host: str) -> Optional[int]:
+    """Weight of a host's second-level label, or None if it is not a known source."""
+    labels = host.split(".")
+    if len(labels) < 2:
+        return None
+    return _SOURCE_WEIGHTS.get(labels[-2])
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_date(value: str) -> Optional[datetime]:
+    """Parse an ISO date or datetime string, ignoring any time zone.
+
+    Feed items from one source tend to share dates, so results are memoized.
+    """
+    try:
+        return datetime.fromisoformat(value.rstrip("Z")[:19]).replace(tzinfo=None)
+    except ValueError:
+        return None
+
+
+def _freshness_score(item: DigestItemInput, now: datetime) -> float:
+    """0-5 score based on how recent the date is.
+
+    Args:
+        item: Item to score.
+        now: Current naive UTC time, read once by the caller for the whole batch.
+    """
     if not item.date:
         return 2.0
-    try:
-        # try ISO and common formats
-        for fmt in ("%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M:%SZ"):
-            try:
-                dt = datetime.strptime(item.date[:19], fmt)
-                break
-            except ValueError:
-                continue
-        else:
-            return 2.0
-        days_old = (datetime.now(timezone.utc).replace(tzinfo=None) - dt).days
-        if days_old <= 1:
-            return 5.0
-        if days_old <= 3:
-            return 4.0
-        if days_old <= 7:
-            return 3.0
-        if days_old <= 30:
-            return 2.0
-        return 1.0
-    except Exception:
+    dt = _parse_date(item.date)
+    if dt is None:
+        return 2.0
+    days_old = (now - dt).days
+    if days_old <= 1:
+        return 5.0
+    if days_old <= 3:
+        return 4.0
+    if days_old <= 7:
+        return 3.0
+    if days_old <= 30:
         return 2.0
+    return 1.0
 
 
-def _content_length_score(item: DigestItemInput) -> float:
-    """0-5 score based on available text length."""
-    text = item.content or item.snippet or ""
-    length = len(text)
+def _length_score(length: int) -> float:
+    """0-5 score for a text length."""
     if length > 5000:
         return 5.0
     if length > 2000:
@@ -96,6 +139,16 @@ def _content_length_score(item: DigestItemInput) -> float:
     return 1.0
 
 
+def _content_length_score(item: DigestItemInput) -> float:
+    """0-5 score based on available text length."""
+    if item.content_pending and item.content_length:
+        # Score deferred content by its recorded length rather than reading it
+        return _length_score(item.content_length)
+
+    text = item.content or item.snippet or ""
+    return _length_score(len(text))
+
+
 def pre_rank(
     items: list[DigestItemInput],
     top_k: int = 30,
@@ -103,22 +156,70 @@ def pre_rank(
     """Step 1 — rank items locally and return the top-K candidates.
 
     Scoring formula: 0.4 * source_weight + 0.3 * freshness + 0.3 * content_length
+
+    Ties are broken by input order. Uses NumPy for scoring and top-K
+    selection when it is installed.
     """
-    scored: list[tuple[float, int, DigestItemInput]] = []
-    for idx, item in enumerate(items):
-        score = (
-            0.4 * _source_weight(item)
-            + 0.3 * _freshness_score(item)
-            + 0.3 * _content_length_score(item)
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    if HAS_NUMPY and items:
+        top = _pre_rank_numpy(items, top_k, now)
+    else:
+        # Partial O(n log k) selection; negated index keeps the earliest of tied items
+        scored = (
+            (
+                0.4 * _source_weight(item)
+                + 0.3 * _freshness_score(item, now)
+                + 0.3 * _content_length_score(item),
+                -idx,
+                item,
+            )
+            for idx, item in enumerate(items)
         )
-        scored.append((score, idx, item))
-
-    scored.sort(key=lambda t: (-t[0], t[1]))
-    top = [item for _, _, item in scored[:top_k]]
+        top = [item for _, _, item in heapq.nlargest(top_k, scored)]
+
+    # Only the candidates sent on to the LLM need their full text
+    for item in top:
+        try:
+            item.load_content()
+        except (OSError, UnicodeDecodeError) as e:
+            # Removed or unreadable since listing: rank on the snippet instead
+            logger.warning("Could not read content for %s: %s", item.url, e)
     logger.info("pre_rank: %d items → top %d", len(items), len(top))
     return top
 
 
+def _pre_rank_numpy(
+    items: list[DigestItemInput], top_k: int, now: datetime
+) -> list[DigestItemInput]:
+    """NumPy implementation of pre_rank's scoring and selection."""
+    n = len(items)
+    # One pass over the items collects all three features
+    features = np.array(
+        [
+            (_source_weight(it), _freshness_score(it, now), _content_length_score(it))
+            for it in items
+        ],
+        dtype=np.float64,
+    )
+    weights, freshness, lengths = features.T
+    # Same operation order as the pure-Python formula, so scores match exactly
+    scores = 0.4 * weights + 0.3 * freshness + 0.3 * lengths
+
+    if top_k <= 0:
+        return []
+    if top_k < n:
+        # O(n) selection of the k-th best score, then keep the earliest ties
+        kth = np.partition(scores, n - top_k)[n - top_k]
+        above = np.flatnonzero(scores > kth)
+        ties = np.flatnonzero(scores == kth)[: top_k - len(above)]
+        candidates = np.concatenate((above, ties))
+    else:
+        candidates = np.arange(n)
+
+    order = candidates[np.lexsort((candidates, -scores[candidates]))]
+    return [items[i] for i in order.tolist()]
+
+
 # ---------------------------------------------------------------------------
 # Cache helpers
 # ---------------------------------------------------------------------------
@@ -127,31 +228,31 @@ def pre_rank(
 def _items_hash(items: list[DigestItemInput]) -> str:
     """Deterministic SHA-256 of the item titles+urls (order-independent)."""
     keys = sorted(f"{it.title}|{it.url}" for it in items)
-    blob = json.dumps(keys, ensure_ascii=False).encode("utf-8")
+    # Unit separator between keys; one buffer hashed in a single call
+    blob = "\x1f".join(keys).encode("utf-8")
     return hashlib.sha256(blob).hexdigest()[:16]
 
 
-def _cache_dir() -> Path:
+def _cache_path(h: str) -> Path:
     settings = get_settings()
-    p = Path(settings.output_dir) / "cache"
-    p.mkdir(parents=True, exist_ok=True)
-    return p
+    return Path(settings.output_dir) / "cache" / f"digest_{h}.json"
 
 
 def _cache_get(h: str) -> Optional[DigestOutput]:
-    path = _cache_dir() / f"digest_{h}.json"
-    if path.exists():
-        logger.info("Cache HIT: %s", path.name)
-        return DigestOutput.model_validate_json(path.read_text(encoding="utf-8"))
-    return None
+    path = _cache_path(h)
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return None
+    logger.info("Cache HIT: %s", path.name)
+    return DigestOutput.model_validate_json(data)
 
 
 def _cache_put(h: str, output: DigestOutput) -> None:
-    path = _cache_dir() / f"digest_{h}.json"
-    path.write_text(
-        output.model_dump_json(indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
+    path = _cache_path(h)
+    # The directory is only needed on write; cache lookups skip the mkdir
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(orjson.dumps(output.model_dump(), option=orjson.OPT_INDENT_2))
     logger.info("Cached digest → %s", path.name)
 
 
@@ -214,10 +315,14 @@ DIGEST_SYSTEM_PROMPT = r"""你是 "AI Frontier Web Digest Generator"。把输入
 # ---------------------------------------------------------------------------
 
 
+# Characters replaced by hyphens in item IDs (CJK ideographs are kept)
+_SLUG_RE = re.compile(r"[^a-z0-9\u4e00-\u9fff]+")
+
+
 def _slugify(text: str) -> str:
     """Simple slug generator for item IDs."""
     text = text.lower().strip()
-    text = re.sub(r"[^a-z0-9\u4e00-\u9fff]+", "-", text)
+    text = _SLUG_RE.sub("-", text)
     return text.strip("-")[:60]
 
 
@@ -314,16 +419,14 @@ def generate_digest_json(
         return result
 
     # Prepare items payload (strip long content to save tokens)
-    items_payload = []
-    for it in items:
-        d = it.model_dump(exclude_none=True)
+    items_payload = _ITEMS_ADAPTER.dump_python(items, exclude_none=True)
+    for d in items_payload:
         # cap content at 3000 chars per item to save tokens
         if d.get("content") and len(d["content"]) > 3000:
             d["content"] = d["content"][:3000] + "…"
-        items_payload.append(d)
 
     user_prompt = (
-        f"items = {json.dumps(items_payload, ensure_ascii=False, indent=None)}\n\n"
+        f"items = {orjson.dumps(items_payload).decode()}\n\n"
         f"共 {all_count} 条原始输入，上面是 pre-rank 后的 Top {len(items)} 条。"
     )
 
@@ -1,16 +1,48 @@
 """Content extraction from HTML for GAD."""
 
+import hashlib
+import html as html_lib
 import logging
 import re
+import threading
+from collections import OrderedDict
 from typing import Optional
 
 from bs4 import BeautifulSoup
+from bs4.filter import SoupStrainer
 
 from gad.models import ExtractedContent
 
 
 logger = logging.getLogger(__name__)
 
+# Below this many pages, starting worker processes costs more than it saves
+PARALLEL_MIN_PAGES = 4
+
+# Recent extraction results keyed by a digest of the page and its URL and media
+# type, so retried or re-ingested pages skip parsing. Least recently used first.
+_EXTRACT_CACHE: OrderedDict[bytes, ExtractedContent] = OrderedDict()
+_EXTRACT_CACHE_SIZE = 128
+# Pages are extracted on several threads at once; the lock guards only the
+# cache bookkeeping, never the extraction itself
+_EXTRACT_CACHE_LOCK = threading.Lock()
+
+# Media types parsed as HTML; other text types are taken as plain text
+_HTML_TYPES = frozenset({"text/html", "application/xhtml+xml"})
+
+# Metadata lives in <head>; pages whose head ends later than this are parsed fully
+_HEAD_SCAN_LIMIT = 32768
+_HEAD_END_RE = re.compile(r"</head\s*>", re.IGNORECASE)
+_TITLE_RE = re.compile(r"<title\b[^>]*>([^<]*)</title\s*>", re.IGNORECASE)
+_META_TAG_RE = re.compile(r"<meta\s([^>]*)>", re.IGNORECASE)
+_ATTR_RE = re.compile(r"""([^\s=/>]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""")
+
+# Meta tags holding the title, author and published date, as (attribute, value)
+# pairs in order of preference
+_META_TITLE_KEYS = (("property", "og:title"),)
+_META_AUTHOR_KEYS = (("property", "article:author"), ("name", "author"))
+_META_DATE_KEYS = (("property", "article:published_time"), ("name", "date"))
+
 
 # Try to import trafilatura, fall back to None if not available
 try:
@@ -27,6 +59,65 @@ except ImportError:
     HAS_TRAFILATURA = False
     logger.warning("trafilatura not available, using fallback extraction")
 
+# lxml's C tokenizer parses several times faster than the pure-Python html.parser.
+# It is a declared dependency; the fallback only covers broken or minimal installs.
+try:
+    import lxml.html
+    from lxml import etree
+
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+_HTML_PARSER = "lxml" if HAS_LXML else "html.parser"
+
+# Parse filters that keep only what a caller reads, so inline scripts, styles
+# and the like outside it never become tree nodes. Tags are tested until one
+# matches, so metadata tags are found anywhere. Only lxml always wraps content
+# in a <body>, so the body filter is skipped with html.parser.
+_META_STRAINER = SoupStrainer(["head", "title", "meta"])
+_BODY_STRAINER = SoupStrainer("body") if HAS_LXML else None
+
+# selectolax (Lexbor, in C) is optional; it is the fast path for pages with a main element
+try:
+    from selectolax.lexbor import LexborHTMLParser
+
+    HAS_SELECTOLAX = True
+except ImportError:
+    LexborHTMLParser = None  # type: ignore
+    HAS_SELECTOLAX = False
+
+# Boilerplate elements dropped before taking text, and selectors for main content
+_BOILERPLATE_TAGS = [
+    "script",
+    "style",
+    "noscript",
+    "template",
+    "iframe",
+    "svg",
+    "nav",
+    "header",
+    "footer",
+    "aside",
+]
+_MAIN_SELECTORS = ["article", "main", '[role="main"]', ".content", "#content"]
+
+# XPath equivalents of _MAIN_SELECTORS, in the same order, for extract_with_lxml
+_MAIN_XPATHS = (
+    tuple(
+        etree.XPath(f"({path})[1]")
+        for path in (
+            "//article",
+            "//main",
+            '//*[@role="main"]',
+            '//*[contains(concat(" ", normalize-space(@class), " "), " content ")]',
+            '//*[@id="content"]',
+        )
+    )
+    if HAS_LXML
+    else ()
+)
+
 
 def normalize_whitespace(text: str) -> str:
     """Collapse multiple whitespace characters into single spaces.
@@ -37,58 +128,126 @@ def normalize_whitespace(text: str) -> str:
     Returns:
         Text with collapsed whitespace.
     """
-    # Replace multiple whitespace (including newlines) with single space
-    text = re.sub(r"\s+", " ", text)
-    # Strip leading/trailing whitespace
-    text = text.strip()
-    return text
+    # split() drops every run of whitespace (including newlines) and the ends
+    # in one C pass; it matches the same characters as the regex \s
+    return " ".join(text.split())
+
+
+def parse_html(html: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """Parse HTML with the fastest available parser.
+
+    Args:
+        html: The HTML content.
+        parse_only: Optional filter limiting which elements are built.
+
+    Returns:
+        Parsed document.
+    """
+    return BeautifulSoup(html, _HTML_PARSER, parse_only=parse_only)
+
 
+def _scan_head_meta(
+    html: str,
+) -> Optional[tuple[Optional[str], Optional[str], Optional[str]]]:
+    """Read title, author and date from the <head> with regexes.
 
-def extract_meta_info(html: str) -> tuple[Optional[str], Optional[str], Optional[str]]:
+    Mirrors extract_meta_info without tokenizing the whole document.
+
+    Args:
+        html: The HTML content.
+
+    Returns:
+        Tuple of (title, author, published_date), or None when the head could
+        not be located or held none of them.
+    """
+    head_end = _HEAD_END_RE.search(html, 0, _HEAD_SCAN_LIMIT)
+    if head_end is None:
+        return None
+    head = html[: head_end.start()]
+
+    # First tag per (attribute, value) wins, as in extract_meta_info
+    metas: dict[tuple[str, str], str] = {}
+    for tag in _META_TAG_RE.finditer(head):
+        attrs = {
+            m.group(1).lower(): m.group(2) or m.group(3) or m.group(4) or ""
+            for m in _ATTR_RE.finditer(tag.group(1))
+        }
+        content = html_lib.unescape(attrs.get("content", ""))
+        for key in ("property", "name"):
+            if key in attrs:
+                metas.setdefault((key, attrs[key]), content)
+
+    title = None
+    title_match = _TITLE_RE.search(head)
+    if title_match and title_match.group(1):
+        title = html_lib.unescape(title_match.group(1)).strip()
+    title, author, published_date = _pick_meta(title, metas)
+
+    if title is None and author is None and published_date is None:
+        return None
+    return title, author, published_date
+
+
+def extract_meta_info(
+    html: str, soup: Optional[BeautifulSoup] = None
+) -> tuple[Optional[str], Optional[str], Optional[str]]:
     """Extract title, author, and published date from HTML meta tags.
 
+    Without a parsed document, the <head> is scanned with regexes first and the
+    page is only parsed when that finds nothing.
+
     Args:
         html: The HTML content.
+        soup: Already parsed document, to avoid parsing html again.
 
     Returns:
         Tuple of (title, author, published_date), any can be None.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    if soup is None:
+        meta = _scan_head_meta(html)
+        if meta is not None:
+            return meta
+        soup = parse_html(html, _META_STRAINER)
 
     # Extract title
     title = None
     if soup.title and soup.title.string:
         title = soup.title.string.strip()
 
-    # Try Open Graph title
-    og_title = soup.find("meta", property="og:title")
-    if og_title and og_title.get("content"):
-        title = og_title["content"].strip()
-
-    # Extract author
-    author = None
-    author_meta = soup.find("meta", attrs={"name": "author"})
-    if author_meta and author_meta.get("content"):
-        author = author_meta["content"].strip()
-
-    # Try article:author
-    article_author = soup.find("meta", property="article:author")
-    if article_author and article_author.get("content"):
-        author = article_author["content"].strip()
-
-    # Extract published date
-    published_date = None
-    date_meta = soup.find("meta", property="article:published_time")
-    if date_meta and date_meta.get("content"):
-        published_date = date_meta["content"].strip()
-
-    # Try other date meta tags
-    if not published_date:
-        date_meta = soup.find("meta", attrs={"name": "date"})
-        if date_meta and date_meta.get("content"):
-            published_date = date_meta["content"].strip()
+    # Index every meta tag in one walk of the tree; the first per key wins
+    metas: dict[tuple[str, str], str] = {}
+    for tag in soup.find_all("meta"):
+        # bs4 types attributes as str or a list of values; these are single-valued
+        content = tag.get("content")
+        for key in ("property", "name"):
+            value = tag.get(key)
+            if isinstance(value, str):
+                metas.setdefault((key, value), content if isinstance(content, str) else "")
 
-    return title, author, published_date
+    return _pick_meta(title, metas)
+
+
+def _pick_meta(
+    title: Optional[str], metas: dict[tuple[str, str], str]
+) -> tuple[Optional[str], Optional[str], Optional[str]]:
+    """Choose title, author and published date from a page's meta tags.
+
+    Args:
+        title: Text of the <title> element, if any.
+        metas: Content of the first meta tag per (attribute, value) pair.
+
+    Returns:
+        Tuple of (title, author, published_date); og:title overrides title.
+    """
+
+    def first(keys: tuple[tuple[str, str], ...]) -> Optional[str]:
+        for key in keys:
+            content = metas.get(key)
+            if content:
+                return content.strip()
+        return None
+
+    return first(_META_TITLE_KEYS) or title, first(_META_AUTHOR_KEYS), first(_META_DATE_KEYS)
 
 
 def extract_with_trafilatura(html: str, url: Optional[str] = None) -> Optional[str]:
@@ -122,24 +281,98 @@ def extract_with_trafilatura(html: str, url: Optional[str] = None) -> Optional[s
     return None
 
 
-def extract_with_beautifulsoup(html: str) -> str:
+def extract_with_selectolax(html: str, body_fallback: bool = False) -> Optional[str]:
+    """Extract the main content element's text using selectolax.
+
+    By default only pages with an explicit main-content element are handled;
+    others are left to trafilatura's boilerplate detection.
+
+    Args:
+        html: The HTML content.
+        body_fallback: Take the body text when no main element matches, as
+            extract_with_beautifulsoup does.
+
+    Returns:
+        Extracted text, or None if selectolax is unavailable or no main element
+        matched and body_fallback is off.
+    """
+    if not HAS_SELECTOLAX:
+        return None
+
+    tree = LexborHTMLParser(html)
+    tree.strip_tags(_BOILERPLATE_TAGS)
+    for selector in _MAIN_SELECTORS:
+        node = tree.css_first(selector)
+        if node is not None:
+            logger.debug(f"Extracted with selectolax ({selector})")
+            return node.text(separator=" ", strip=True)
+
+    if not body_fallback:
+        return None
+    body = tree.body or tree.root
+    return body.text(separator=" ", strip=True) if body is not None else ""
+
+
+def extract_with_lxml(html: str) -> Optional[str]:
+    """Extract text like extract_with_beautifulsoup, walking the tree in C with lxml.
+
+    Args:
+        html: The HTML content.
+
+    Returns:
+        The text extract_with_beautifulsoup returns, with whitespace already
+        normalized, or None if lxml is unavailable or cannot parse the document.
+    """
+    if not HAS_LXML:
+        return None
+
+    try:
+        root = lxml.html.document_fromstring(html)
+    except (etree.ParserError, ValueError) as e:
+        logger.debug(f"lxml could not parse document: {e}")
+        return None
+
+    # Tails are text that follows the element, so they are kept
+    etree.strip_elements(root, *_BOILERPLATE_TAGS, with_tail=False)
+
+    for xpath in _MAIN_XPATHS:
+        found = xpath(root)
+        if found:
+            node = found[0]
+            break
+    else:
+        # Fall back to body; lxml only omits it when the page has no body content
+        bodies = root.xpath("//body")
+        if not bodies:
+            return ""
+        node = bodies[0]
+
+    # Join the text nodes once and normalize the result in the same step, rather
+    # than stripping each node and normalizing the joined text again afterwards
+    return " ".join(" ".join(node.itertext()).split())
+
+
+def extract_with_beautifulsoup(html: str, soup: Optional[BeautifulSoup] = None) -> str:
     """Extract text content using BeautifulSoup as fallback.
 
     Args:
         html: The HTML content.
+        soup: Already parsed document, to avoid parsing html again. Boilerplate
+            elements are removed from it in place.
 
     Returns:
         Extracted text content.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    if soup is None:
+        soup = parse_html(html, _BODY_STRAINER)
 
-    # Remove script and style elements
-    for element in soup(["script", "style", "nav", "header", "footer", "aside"]):
+    # Remove scripts, styles and other boilerplate in one walk of the tree
+    for element in soup(_BOILERPLATE_TAGS):
         element.decompose()
 
     # Try to find main content areas
     main_content = None
-    for selector in ["article", "main", '[role="main"]', ".content", "#content"]:
+    for selector in _MAIN_SELECTORS:
         if selector.startswith(".") or selector.startswith("#"):
             main_content = soup.select_one(selector)
         else:
@@ -160,41 +393,140 @@ def extract_with_beautifulsoup(html: str) -> str:
     return text
 
 
-def extract_content(html: str, url: Optional[str] = None) -> ExtractedContent:
+def extract_content(
+    html: str, url: Optional[str] = None, content_type: Optional[str] = None
+) -> ExtractedContent:
     """Extract clean text content from HTML.
 
-    Uses trafilatura as primary extractor with BeautifulSoup fallback.
+    Uses selectolax for pages with a main-content element when it is
+    installed, then trafilatura. Failing both, the main element or body text
+    is taken with selectolax, lxml or BeautifulSoup, whichever is available.
 
     Args:
         html: The HTML content.
         url: Optional URL for context.
+        content_type: Media type of the response, if known. Plain text skips
+            HTML parsing and other non-HTML types yield no content.
 
     Returns:
         ExtractedContent with title, author, text, and word count.
     """
-    logger.debug(f"Extracting content from HTML ({len(html)} chars)")
-
-    # Extract metadata first
-    title, author, published_date = extract_meta_info(html)
+    # Empty responses (errors, redirects) have nothing to parse
+    if not html or html.isspace():
+        logger.warning("No content could be extracted")
+        return ExtractedContent.from_text("", word_count=0)
+
+    key = _extract_cache_key(html, url, content_type)
+    with _EXTRACT_CACHE_LOCK:
+        cached = _EXTRACT_CACHE.get(key)
+        if cached is not None:
+            _EXTRACT_CACHE.move_to_end(key)
+    if cached is not None:
+        logger.debug(f"Reusing extraction of {url or 'page'} ({len(html)} chars)")
+        return cached
+
+    extracted = _extract_content(html, url, content_type)
+    with _EXTRACT_CACHE_LOCK:
+        _EXTRACT_CACHE[key] = extracted
+        if len(_EXTRACT_CACHE) > _EXTRACT_CACHE_SIZE:
+            _EXTRACT_CACHE.popitem(last=False)
+    return extracted
+
+
+def _extract_cache_key(html: str, url: Optional[str], content_type: Optional[str]) -> bytes:
+    """Digest the inputs of extract_content for _EXTRACT_CACHE."""
+    h = hashlib.blake2b(html.encode("utf-8", "surrogatepass"), digest_size=16)
+    h.update(f"\x00{url or ''}\x00{content_type or ''}".encode("utf-8", "surrogatepass"))
+    return h.digest()
+
+
+def _extract_content(
+    html: str, url: Optional[str], content_type: Optional[str]
+) -> ExtractedContent:
+    """Extract content without consulting the cache; see extract_content."""
+    if content_type and content_type not in _HTML_TYPES:
+        if not content_type.startswith("text/"):
+            logger.warning(f"Not extracting content of type {content_type}")
+            return ExtractedContent.from_text("")
+        logger.debug(f"Taking {content_type} content as plain text ({len(html)} chars)")
+        text, word_count = _normalize_and_count(html)
+        return ExtractedContent.from_text(text, word_count=word_count)
 
-    # Try trafilatura first
-    text = extract_with_trafilatura(html, url)
+    logger.debug(f"Extracting content from HTML ({len(html)} chars)")
 
-    # Fall back to BeautifulSoup
-    if not text or len(text.strip()) < 100:
-        logger.debug("Using BeautifulSoup fallback extraction")
-        text = extract_with_beautifulsoup(html)
+    # Without lxml, metadata and the BeautifulSoup extractor share one parse
+    soup: Optional[BeautifulSoup] = None
 
-    # Normalize whitespace
-    text = normalize_whitespace(text)
+    # Extract metadata first, from the <head> alone when possible
+    meta = _scan_head_meta(html)
+    if meta is None:
+        if HAS_LXML:
+            # Text comes from lxml, so this parse only needs the metadata
+            meta = extract_meta_info(html, parse_html(html, _META_STRAINER))
+        else:
+            soup = parse_html(html)
+            meta = extract_meta_info(html, soup)
+    title, author, published_date = meta
+
+    # Fast C extraction first, trafilatura for pages it cannot handle well
+    main_text = extract_with_selectolax(html)
+    if not main_text or len(main_text.strip()) < 100:
+        main_text = extract_with_trafilatura(html, url)
+
+    if main_text and len(main_text.strip()) >= 100:
+        # Normalize whitespace
+        text, word_count = _normalize_and_count(main_text)
+    else:
+        text, word_count = _extract_fallback_text(html, soup)
 
     if not text:
         logger.warning("No content could be extracted")
-        text = ""
 
     return ExtractedContent.from_text(
         text=text,
         title=title or "Untitled",
         author=author,
         published_date=published_date,
+        word_count=word_count,
     )
+
+
+def _extract_fallback_text(html: str, soup: Optional[BeautifulSoup]) -> tuple[str, int]:
+    """Take the main element or body text with the fastest parser available.
+
+    Args:
+        html: The HTML content.
+        soup: Already parsed document for the BeautifulSoup fallback, if any.
+
+    Returns:
+        Tuple of (whitespace-normalized text, word count).
+    """
+    text = extract_with_selectolax(html, body_fallback=True)
+    if text is not None:
+        return _normalize_and_count(text)
+
+    # lxml's text comes back already normalized
+    text = extract_with_lxml(html)
+    if text is not None:
+        return text, _count_words(text)
+
+    logger.debug("Using BeautifulSoup fallback extraction")
+    return _normalize_and_count(extract_with_beautifulsoup(html, soup))
+
+
+def _normalize_and_count(text: str) -> tuple[str, int]:
+    """Normalize whitespace as normalize_whitespace does and count the words.
+
+    The word count comes from the same split, so the text is scanned once.
+    """
+    words = text.split()
+    return " ".join(words), len(words)
+
+
+def _count_words(normalized: str) -> int:
+    """Count the words of whitespace-normalized text.
+
+    Equal to len(normalized.split()) for output of normalize_whitespace,
+    whose words are separated by single spaces, without building the list.
+    """
+    return normalized.count(" ") + 1 if normalized else 0
@@ -1,25 +1,179 @@
 """URL and RSS feed fetching for GAD."""
 
+import asyncio
+import atexit
 import logging
-from typing import Optional
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any, Optional
 from urllib.parse import urlparse
 
 import feedparser
 import httpx
+import orjson
 
 from gad.config import get_settings
-from gad.models import FeedItem
+from gad.models import FeedItem, FetchResult
 
 
 logger = logging.getLogger(__name__)
 
 
+# HTTP/2 needs the optional h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
+# Connection pool sizing shared by the sync and async clients
+_POOL_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+# Shared clients, created on first use so TCP/TLS connections are reused
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+_async_client: Optional[httpx.AsyncClient] = None
+_async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Common feed URL patterns. Equivalent to the substrings /feed, /rss, /atom,
+# .rss, .atom and .xml anywhere in the path; longer names such as /feeds/ or
+# index.xml are covered by these.
+_FEED_PATH_RE = re.compile(r"/(?:feed|rss|atom)|\.(?:rss|atom|xml)")
+
+# Accept header for feed requests
+_FEED_ACCEPT = (
+    "application/rss+xml, application/atom+xml, application/xml;q=0.9, text/xml;q=0.9, */*;q=0.8"
+)
+
+# Conditional-GET validators and items per feed URL, persisted to feeds.json
+_feed_cache: Optional[dict[str, dict[str, Any]]] = None
+_feed_cache_lock = threading.Lock()
+
+
 class FetchError(Exception):
     """Error fetching a URL."""
 
     pass
 
 
+def _request_headers() -> dict[str, str]:
+    """Build the request headers used for article fetches."""
+    settings = get_settings()
+    return {
+        "User-Agent": settings.http.user_agent,
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.5",
+    }
+
+
+def _to_fetch_error(url: str, error: httpx.HTTPError) -> FetchError:
+    """Log an httpx error and convert it to a FetchError."""
+    if isinstance(error, httpx.TimeoutException):
+        logger.error(f"Timeout fetching {url}: {error}")
+        return FetchError(f"Timeout fetching URL: {url}")
+    if isinstance(error, httpx.HTTPStatusError):
+        logger.error(f"HTTP error fetching {url}: {error.response.status_code}")
+        return FetchError(f"HTTP {error.response.status_code} for URL: {url}")
+    logger.error(f"Request error fetching {url}: {error}")
+    return FetchError(f"Failed to fetch URL: {url}")
+
+
+def get_client() -> httpx.Client:
+    """Get the shared, connection-pooled HTTP client.
+
+    The client is created on first use and closed at interpreter exit.
+
+    Returns:
+        The shared httpx.Client.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            settings = get_settings()
+            _client = httpx.Client(
+                http2=HAS_HTTP2,
+                timeout=settings.http.timeout,
+                headers=_request_headers(),
+                limits=_POOL_LIMITS,
+                follow_redirects=True,
+            )
+            atexit.register(_client.close)
+        return _client
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Get the shared async HTTP client for the running event loop.
+
+    An AsyncClient is tied to the loop it was first used on, so a new one is
+    created whenever the running loop changes. Call `aclose_async_client`
+    before the loop finishes to release its connections.
+
+    Returns:
+        The shared httpx.AsyncClient.
+    """
+    global _async_client, _async_client_loop
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client_loop is not loop:
+        settings = get_settings()
+        _async_client = httpx.AsyncClient(
+            http2=HAS_HTTP2,
+            timeout=settings.http.timeout,
+            headers=_request_headers(),
+            limits=_POOL_LIMITS,
+            follow_redirects=True,
+        )
+        _async_client_loop = loop
+    return _async_client
+
+
+async def aclose_async_client() -> None:
+    """Close the shared async HTTP client, if one is open."""
+    global _async_client, _async_client_loop
+    if _async_client is not None:
+        client, _async_client, _async_client_loop = _async_client, None, None
+        await client.aclose()
+
+
+def _to_fetch_result(response: httpx.Response) -> FetchResult:
+    """Build a FetchResult from a successful response."""
+    content_type = response.headers.get("content-type", "")
+    return FetchResult(
+        text=response.text,
+        content_type=content_type.partition(";")[0].strip().lower(),
+        encoding=response.encoding,
+    )
+
+
+def fetch_page(url: str, timeout: Optional[int] = None) -> FetchResult:
+    """Fetch a URL along with its content type.
+
+    Args:
+        url: The URL to fetch.
+        timeout: Optional timeout override in seconds.
+
+    Returns:
+        FetchResult with the decoded body and its media type.
+
+    Raises:
+        FetchError: If the request fails.
+    """
+    client = get_client()
+
+    try:
+        logger.debug(f"Fetching URL: {url}")
+        if timeout:
+            response = client.get(url, timeout=timeout)
+        else:
+            response = client.get(url)
+        response.raise_for_status()
+        return _to_fetch_result(response)
+    except httpx.HTTPError as e:
+        raise _to_fetch_error(url, e) from e
+
+
 def fetch_url(url: str, timeout: Optional[int] = None) -> str:
     """Fetch the HTML content of a URL.
 
@@ -33,30 +187,50 @@ def fetch_url(url: str, timeout: Optional[int] = None) -> str:
     Raises:
         FetchError: If the request fails.
     """
-    settings = get_settings()
-    timeout = timeout or settings.http.timeout
+    return fetch_page(url, timeout).text
 
-    headers = {
-        "User-Agent": settings.http.user_agent,
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.5",
-    }
+
+async def fetch_page_async(url: str, timeout: Optional[int] = None) -> FetchResult:
+    """Fetch a URL along with its content type without blocking the event loop.
+
+    Args:
+        url: The URL to fetch.
+        timeout: Optional timeout override in seconds.
+
+    Returns:
+        FetchResult with the decoded body and its media type.
+
+    Raises:
+        FetchError: If the request fails.
+    """
+    client = get_async_client()
 
     try:
         logger.debug(f"Fetching URL: {url}")
-        with httpx.Client(timeout=timeout, follow_redirects=True) as client:
-            response = client.get(url, headers=headers)
-            response.raise_for_status()
-            return response.text
-    except httpx.TimeoutException as e:
-        logger.error(f"Timeout fetching {url}: {e}")
-        raise FetchError(f"Timeout fetching URL: {url}") from e
-    except httpx.HTTPStatusError as e:
-        logger.error(f"HTTP error fetching {url}: {e.response.status_code}")
-        raise FetchError(f"HTTP {e.response.status_code} for URL: {url}") from e
-    except httpx.RequestError as e:
-        logger.error(f"Request error fetching {url}: {e}")
-        raise FetchError(f"Failed to fetch URL: {url}") from e
+        if timeout:
+            response = await client.get(url, timeout=timeout)
+        else:
+            response = await client.get(url)
+        response.raise_for_status()
+        return _to_fetch_result(response)
+    except httpx.HTTPError as e:
+        raise _to_fetch_error(url, e) from e
+
+
+async def fetch_url_async(url: str, timeout: Optional[int] = None) -> str:
+    """Fetch the HTML content of a URL without blocking the event loop.
+
+    Args:
+        url: The URL to fetch.
+        timeout: Optional timeout override in seconds.
+
+    Returns:
+        The HTML content as a string.
+
+    Raises:
+        FetchError: If the request fails.
+    """
+    return (await fetch_page_async(url, timeout)).text
 
 
 def is_feed_url(url: str) -> bool:
@@ -70,30 +244,50 @@ def is_feed_url(url: str) -> bool:
     Returns:
         True if the URL is likely a feed.
     """
-    parsed = urlparse(url)
-    path = parsed.path.lower()
-
-    # Common feed URL patterns
-    feed_indicators = [
-        "/feed",
-        "/rss",
-        "/atom",
-        ".rss",
-        ".atom",
-        ".xml",
-        "/feeds/",
-        "feed.xml",
-        "rss.xml",
-        "atom.xml",
-        "index.xml",
-    ]
-
-    return any(indicator in path for indicator in feed_indicators)
+    return _FEED_PATH_RE.search(urlparse(url).path.lower()) is not None
+
+
+def _feed_cache_file() -> Path:
+    """Get the path of the on-disk feed cache."""
+    return get_settings().cache_dir / "feeds.json"
+
+
+def _get_feed_cache() -> dict[str, dict[str, Any]]:
+    """Load the feed cache on first use. Caller must hold _feed_cache_lock."""
+    global _feed_cache
+    if _feed_cache is None:
+        try:
+            _feed_cache = orjson.loads(_feed_cache_file().read_bytes())
+        except FileNotFoundError:
+            _feed_cache = {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable feed cache: {e}")
+            _feed_cache = {}
+    return _feed_cache
+
+
+def _store_feed_cache_entry(url: str, entry: dict[str, Any]) -> None:
+    """Record a feed's validators and items and persist the cache."""
+    with _feed_cache_lock:
+        cache = _get_feed_cache()
+        cache[url] = entry
+        cache_file = _feed_cache_file()
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            tmp_file.write_bytes(orjson.dumps(cache))
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logger.warning(f"Could not write feed cache: {e}")
 
 
 def parse_feed(url: str, limit: Optional[int] = None) -> list[FeedItem]:
     """Parse an RSS/Atom feed and extract items.
 
+    Feeds that send an ETag or Last-Modified header are cached in
+    ``<output_dir>/cache/feeds.json``; later requests send the validators
+    back and reuse the cached items when the server answers 304 Not Modified.
+
     Args:
         url: The feed URL.
         limit: Optional maximum number of items to return.
@@ -106,18 +300,33 @@ def parse_feed(url: str, limit: Optional[int] = None) -> list[FeedItem]:
     """
     logger.debug(f"Parsing feed: {url}")
 
-    try:
-        feed = feedparser.parse(url)
+    with _feed_cache_lock:
+        cached = _get_feed_cache().get(url)
+
+    headers: dict[str, str] = {"Accept": _FEED_ACCEPT}
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached and cached.get("modified"):
+        headers["If-Modified-Since"] = cached["modified"]
 
+    try:
+        response = get_client().get(url, headers=headers)
+        if cached is not None and response.status_code == 304:
+            cached_items = [FeedItem.model_validate(item) for item in cached["items"][:limit]]
+            logger.info(f"Feed not modified, reusing {len(cached_items)} cached items: {url}")
+            return cached_items
+        response.raise_for_status()
+
+        feed = feedparser.parse(
+            response.content,
+            response_headers={k.lower(): v for k, v in response.headers.items()},
+        )
         if feed.bozo and not feed.entries:
             logger.error(f"Failed to parse feed {url}: {feed.bozo_exception}")
             raise FetchError(f"Failed to parse feed: {url}")
 
         items: list[FeedItem] = []
         for entry in feed.entries:
-            if limit is not None and len(items) >= limit:
-                break
-
             link = entry.get("link", "")
             if not link:
                 continue
@@ -127,6 +336,19 @@ def parse_feed(url: str, limit: Optional[int] = None) -> list[FeedItem]:
 
             items.append(FeedItem(title=title, link=link, published=published))
 
+        etag, modified = response.headers.get("etag"), response.headers.get("last-modified")
+        if items and (etag or modified):
+            _store_feed_cache_entry(
+                url,
+                {
+                    "etag": etag,
+                    "modified": modified,
+                    "items": [item.model_dump() for item in items],
+                },
+            )
+
+        if limit is not None:
+            items = items[:limit]
         logger.info(f"Parsed {len(items)} items from feed: {url}")
         return items
 
@@ -2,9 +2,10 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from pathlib import Path
+from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 
 class SourceType(str, Enum):
@@ -18,16 +19,20 @@ class SeenRecord(BaseModel):
     """Record stored in seen.jsonl for deduplication tracking."""
 
     url: str = Field(description="Original URL of the article")
-    url_hash: str = Field(description="SHA256 hash of normalized URL")
-    content_hash: str = Field(description="SHA256 hash of normalized content")
+    url_hash: str = Field(description="First 64 bits of the SHA256 of normalized URL, as hex")
+    content_hash: str = Field(description="First 64 bits of SHA256 of normalized content, as hex")
     title: str = Field(description="Article title")
     fetched_at: datetime = Field(description="When the article was fetched")
     stored_path: str = Field(description="Relative path to stored article directory")
     source: SourceType = Field(description="How the article was ingested")
 
-    def model_dump_jsonl(self) -> str:
-        """Serialize to JSON line format."""
-        return self.model_dump_json()
+    def model_dump_jsonl(self) -> bytes:
+        """Serialize to a newline-terminated UTF-8 JSON line.
+
+        Uses the model's pydantic-core serializer directly, which returns bytes
+        without the str round trip of model_dump_json.
+        """
+        return self.__pydantic_serializer__.to_json(self) + b"\n"
 
 
 class ArticleMeta(BaseModel):
@@ -37,16 +42,25 @@ class ArticleMeta(BaseModel):
     author: Optional[str] = Field(default=None, description="Author if found")
     published_date: Optional[str] = Field(default=None, description="Published date if found")
     url: str = Field(description="Original URL")
-    url_hash: str = Field(description="SHA256 hash of normalized URL")
-    content_hash: str = Field(description="SHA256 hash of content")
+    url_hash: str = Field(description="First 64 bits of the SHA256 of normalized URL, as hex")
+    content_hash: str = Field(description="First 64 bits of SHA256 of normalized content, as hex")
     fetched_at: datetime = Field(description="When the article was fetched")
     word_count: int = Field(description="Word count of extracted content")
+    char_count: Optional[int] = Field(
+        default=None, description="Character count of extracted content (unset in older articles)"
+    )
     tags: list[str] = Field(default_factory=list, description="Tags applied to article")
     source: SourceType = Field(description="How the article was ingested")
 
 
 class ExtractedContent(BaseModel):
-    """Extracted content from an article."""
+    """Extracted content from an article.
+
+    Immutable, so one instance can be shared between callers (see the
+    extraction cache in gad.extract).
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     title: str = Field(description="Article title")
     author: Optional[str] = Field(default=None, description="Author if found")
@@ -61,9 +75,14 @@ class ExtractedContent(BaseModel):
         title: str = "Untitled",
         author: Optional[str] = None,
         published_date: Optional[str] = None,
+        word_count: Optional[int] = None,
     ) -> "ExtractedContent":
-        """Create ExtractedContent from text with computed word count."""
-        word_count = len(text.split())
+        """Create ExtractedContent from text with computed word count.
+
+        Pass word_count when it is already known to skip counting.
+        """
+        if word_count is None:
+            word_count = len(text.split())
         return cls(
             title=title,
             author=author,
@@ -73,6 +92,14 @@ class ExtractedContent(BaseModel):
         )
 
 
+class FetchResult(BaseModel):
+    """A fetched page and how it was encoded."""
+
+    text: str = Field(description="Decoded response body")
+    content_type: str = Field(default="", description="Media type without parameters")
+    encoding: Optional[str] = Field(default=None, description="Charset used to decode the body")
+
+
 class FeedItem(BaseModel):
     """An item from an RSS/Atom feed."""
 
@@ -111,6 +138,57 @@ class DigestItemInput(BaseModel):
     author: Optional[str] = None
     tags: list[str] = Field(default_factory=list)
 
+    # Library items defer reading content.txt until the content is needed
+    _content_path: Optional[Path] = PrivateAttr(default=None)
+    _content_length: int = PrivateAttr(default=0)
+
+    @classmethod
+    def with_lazy_content(
+        cls, content_path: Path, content_length: Optional[int] = None, **data: Any
+    ) -> "DigestItemInput":
+        """Create an item whose content is read from a file on first use.
+
+        Args:
+            content_path: Path to the article's content.txt.
+            content_length: Length of the content in characters, as recorded
+                when it was written. If None, the file size in bytes is used,
+                which overcounts multi-byte scripts.
+            **data: Remaining field values.
+
+        Returns:
+            A DigestItemInput with content deferred.
+        """
+        item = cls(**data)
+        try:
+            if content_length is None:
+                content_length = content_path.stat().st_size
+            item._content_length = content_length
+            item._content_path = content_path
+        except FileNotFoundError:
+            pass
+        return item
+
+    @property
+    def content_pending(self) -> bool:
+        """Whether content is deferred and not yet read."""
+        return self._content_path is not None
+
+    @property
+    def content_length(self) -> int:
+        """Length in characters of the deferred content (0 if none)."""
+        return self._content_length
+
+    def load_content(self) -> Optional[str]:
+        """Read deferred content into ``content`` and return it.
+
+        The file is only tried once; if reading it raises, later calls
+        return the current ``content`` (None) without retrying.
+        """
+        if self._content_path is not None:
+            content_path, self._content_path = self._content_path, None
+            self.content = content_path.read_text(encoding="utf-8")
+        return self.content
+
 
 class DigestScores(BaseModel):
     """Importance / credibility / freshness triple."""
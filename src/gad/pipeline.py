@@ -0,0 +1,300 @@
+"""Staged ingestion pipeline for GAD.
+
+Articles flow through four stages connected by asyncio queues:
+
+    fetch -> extract -> summarize -> write
+
+Each stage has its own workers, so fetching the next article, extracting the
+previous one and waiting on the LLM for a third all overlap. Batch wall time
+approaches that of the slowest stage instead of the sum of all stages.
+"""
+
+import asyncio
+import contextlib
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional
+
+from gad.config import Settings
+from gad.dedup import (
+    SeenWriter,
+    compute_content_hash,
+    compute_url_hash,
+    is_duplicate,
+    preload_seen,
+)
+from gad.extract import PARALLEL_MIN_PAGES, extract_content
+from gad.fetch import FetchError, aclose_async_client, fetch_page_async
+from gad.models import ArticleMeta, ExtractedContent, IngestResult, SeenRecord, SourceType
+from gad.render import create_seen_record, write_article
+from gad.summarize import Summarizer, cached_summarize_async
+
+logger = logging.getLogger(__name__)
+
+# Extraction workers are started from a clean server process, never forked from
+# this one: by then the event loop's threads may hold locks (logging, the httpx
+# pool, SSL state) that a forked child would inherit locked
+_MP_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
+@dataclass
+class _WorkItem:
+    """An article moving through the pipeline."""
+
+    url: str
+    source: SourceType
+    html: str = ""
+    content_type: str = ""
+    # Epoch seconds when the response arrived; converted to a datetime only on store
+    fetched_ts: float = 0.0
+    extracted: Optional[ExtractedContent] = None
+    url_hash: str = ""
+    content_hash: str = ""
+    # Whether url_hash and content_hash are held in the run's claimed set
+    claimed: bool = False
+    summary: str = ""
+
+
+async def run_pipeline(
+    jobs: list[tuple[str, SourceType]],
+    tags: list[str],
+    *,
+    settings: Settings,
+    summarizer: Summarizer,
+    on_result: Optional[Callable[[IngestResult], None]] = None,
+) -> list[IngestResult]:
+    """Ingest articles through the staged pipeline.
+
+    Settings and the summarizer are resolved once by the caller and shared by
+    every worker, keeping lookups and client construction off the per-article path.
+
+    Args:
+        jobs: (article_url, source_type) pairs to ingest.
+        tags: Tags applied to every stored article.
+        settings: Settings for this run.
+        summarizer: Summarizer shared by all summarization workers.
+        on_result: Optional callback invoked as each article finishes.
+
+    Returns:
+        One IngestResult per job, in completion order.
+    """
+    seen_file = settings.seen_file
+    fetch_workers = settings.max_concurrency
+    extract_workers = min(settings.extract_workers or os.cpu_count() or 1, max(len(jobs), 1))
+    # Worker processes only pay off for several pages; otherwise extract in this
+    # process (on a thread, keeping the loop responsive)
+    use_pool = extract_workers > 1 and len(jobs) >= PARALLEL_MIN_PAGES
+    if not use_pool:
+        extract_workers = 1
+    summarize_workers = settings.llm_concurrency
+
+    fetch_q: asyncio.Queue[Optional[_WorkItem]] = asyncio.Queue()
+    extract_q: asyncio.Queue[Optional[_WorkItem]] = asyncio.Queue(maxsize=2 * extract_workers)
+    summarize_q: asyncio.Queue[Optional[_WorkItem]] = asyncio.Queue(
+        maxsize=2 * summarize_workers
+    )
+    write_q: asyncio.Queue[Optional[_WorkItem]] = asyncio.Queue()
+
+    results: list[IngestResult] = []
+    # Hashes of articles already past the duplicate check in this run
+    claimed: set[str] = set()
+
+    def finish(result: IngestResult) -> None:
+        results.append(result)
+        if on_result is not None:
+            on_result(result)
+
+    def fail(item: _WorkItem, error: Exception) -> None:
+        # Let a later copy of the URL or content be ingested instead
+        if item.claimed:
+            claimed.difference_update((item.url_hash, item.content_hash))
+            item.claimed = False
+        if not isinstance(error, FetchError):
+            logger.error(f"Error ingesting {item.url}", exc_info=error)
+        finish(IngestResult(url=item.url, success=False, error=str(error)))
+
+    async def fetcher() -> None:
+        while (item := await fetch_q.get()) is not None:
+            try:
+                page = await fetch_page_async(item.url)
+                item.html, item.content_type = page.text, page.content_type
+                item.fetched_ts = time.time()
+            except Exception as e:
+                fail(item, e)
+                continue
+            await extract_q.put(item)
+
+    async def extractor(
+        pool: Optional[ProcessPoolExecutor], seen_loaded: asyncio.Task[None]
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        while (item := await extract_q.get()) is not None:
+            try:
+                extracted = await loop.run_in_executor(
+                    pool, extract_content, item.html, item.url, item.content_type
+                )
+                item.html = ""
+
+                if extracted.word_count < 50:
+                    finish(
+                        IngestResult(
+                            url=item.url, success=False, error="Too little content extracted"
+                        )
+                    )
+                    continue
+
+                # seen.jsonl is scanned on a thread once, so checks below are lookups
+                await seen_loaded
+
+                # No await between the check and the claim, so it is atomic on the loop
+                item.extracted = extracted
+                item.url_hash = compute_url_hash(item.url)
+                item.content_hash = compute_content_hash(extracted.text)
+                is_dup, _ = is_duplicate(
+                    item.url,
+                    extracted.text,
+                    seen_file,
+                    url_hash=item.url_hash,
+                    content_hash=item.content_hash,
+                )
+                if is_dup or item.url_hash in claimed or item.content_hash in claimed:
+                    finish(
+                        IngestResult(
+                            url=item.url, success=False, skipped=True, title=extracted.title
+                        )
+                    )
+                    continue
+                claimed.update((item.url_hash, item.content_hash))
+                item.claimed = True
+            except Exception as e:
+                fail(item, e)
+                continue
+
+            await summarize_q.put(item)
+
+    async def summarizer_worker() -> None:
+        while (item := await summarize_q.get()) is not None:
+            assert item.extracted is not None
+            try:
+                # llm_concurrency workers bound the number of requests in flight
+                item.summary = await cached_summarize_async(
+                    summarizer,
+                    item.extracted.text,
+                    item.extracted.title,
+                    item.content_hash,
+                )
+            except Exception as e:
+                fail(item, e)
+                continue
+            await write_q.put(item)
+
+    async def writer() -> None:
+        # A single writer keeps library and seen.jsonl writes sequential
+        with SeenWriter(seen_file) as seen_writer:
+            while (item := await write_q.get()) is not None:
+                try:
+                    result, seen_record = await asyncio.to_thread(
+                        _store, item, tags, settings.library_dir
+                    )
+                    # Append on the loop so duplicate checks never see a half-written line
+                    seen_writer.write(seen_record)
+                except Exception as e:
+                    fail(item, e)
+                    continue
+                finish(result)
+
+    for url, source in jobs:
+        fetch_q.put_nowait(_WorkItem(url=url, source=source))
+
+    try:
+        # A None pool makes run_in_executor use the loop's default thread pool
+        pool_cm = (
+            ProcessPoolExecutor(max_workers=extract_workers, mp_context=_MP_CONTEXT)
+            if use_pool
+            else contextlib.nullcontext(None)
+        )
+        with pool_cm as pool:
+            # Load the seen index while the first pages are fetched
+            seen_loaded = asyncio.create_task(asyncio.to_thread(preload_seen, seen_file))
+            fetchers = [asyncio.create_task(fetcher()) for _ in range(fetch_workers)]
+            extractors = [
+                asyncio.create_task(extractor(pool, seen_loaded)) for _ in range(extract_workers)
+            ]
+            summarizers = [
+                asyncio.create_task(summarizer_worker()) for _ in range(summarize_workers)
+            ]
+            writer_task = asyncio.create_task(writer())
+
+            # Shut stages down in order: each stage drains before the next is told to stop
+            for _ in fetchers:
+                fetch_q.put_nowait(None)
+            await asyncio.gather(*fetchers)
+            for _ in extractors:
+                await extract_q.put(None)
+            await asyncio.gather(*extractors)
+            # Any preload error was reported for the items that awaited it
+            with contextlib.suppress(Exception):
+                await seen_loaded
+            for _ in summarizers:
+                await summarize_q.put(None)
+            await asyncio.gather(*summarizers)
+            await write_q.put(None)
+            await writer_task
+    finally:
+        await aclose_async_client()
+
+    return results
+
+
+def _store(
+    item: _WorkItem, tags: list[str], library_dir: Path
+) -> tuple[IngestResult, SeenRecord]:
+    """Write a summarized article to the library.
+
+    Returns:
+        Tuple of (result, seen_record); the caller appends the record to seen.jsonl.
+    """
+    extracted = item.extracted
+    assert extracted is not None
+
+    fetched_at = datetime.fromtimestamp(item.fetched_ts)
+    meta = ArticleMeta(
+        title=extracted.title,
+        author=extracted.author,
+        published_date=extracted.published_date,
+        url=item.url,
+        url_hash=item.url_hash,
+        content_hash=item.content_hash,
+        fetched_at=fetched_at,
+        word_count=extracted.word_count,
+        char_count=len(extracted.text),
+        tags=tags,
+        source=item.source,
+    )
+    article_dir = write_article(meta, extracted.text, item.summary, library_dir)
+
+    seen_record = create_seen_record(
+        url=item.url,
+        url_hash=item.url_hash,
+        content_hash=item.content_hash,
+        title=extracted.title,
+        stored_path=article_dir,
+        source=item.source,
+        fetched_at=fetched_at,
+    )
+
+    result = IngestResult(
+        url=item.url,
+        success=True,
+        title=extracted.title,
+        stored_path=str(article_dir),
+    )
+    return result, seen_record
@@ -1,23 +1,50 @@
 """Output rendering for GAD."""
 
-import json
+import functools
 import logging
-import re
+import os
+import shutil
+import threading
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+import orjson
+
 from gad.config import get_settings
 from gad.models import ArticleMeta, SeenRecord, SourceType
 
 
 logger = logging.getLogger(__name__)
 
+# Byte table for slugify: lowercases A-Z, keeps a-z and 0-9, and turns every
+# other byte into a space so str.split() can collapse and trim the runs
+_SLUG_TABLE = bytes(
+    c | 0x20 if 0x41 <= c <= 0x5A else c if 0x61 <= c <= 0x7A or 0x30 <= c <= 0x39 else 0x20
+    for c in range(256)
+)
+
+# Heading of the TL;DR section in a generated summary
+_TLDR_HEADING = "## TL;DR"
+
+# Write buffer for article files; large enough to write most files in one call
+_WRITE_BUFFER_SIZE = 1 << 16
 
+# Threads reading meta.json files in load_articles_for_date. Reads are
+# I/O-bound, so threads overlap them on a cold page cache; below
+# _PARALLEL_MIN_ARTICLES the pool costs more than it saves.
+_META_READ_WORKERS = 8
+_PARALLEL_MIN_ARTICLES = 32
+
+
+@functools.lru_cache(maxsize=4096)
 def slugify(text: str, max_length: int = 50) -> str:
     """Convert text to a URL-friendly slug.
 
+    Results are memoized, so retried or re-ingested titles are slugged once.
+
     Args:
         text: The text to slugify.
         max_length: Maximum length of the slug.
@@ -25,16 +52,14 @@ def slugify(text: str, max_length: int = 50) -> str:
     Returns:
         URL-friendly slug string.
     """
-    # Normalize unicode
-    text = unicodedata.normalize("NFKD", text)
-    # Convert to ASCII
-    text = text.encode("ascii", "ignore").decode("ascii")
-    # Lowercase
-    text = text.lower()
-    # Replace spaces and special chars with hyphens
-    text = re.sub(r"[^a-z0-9]+", "-", text)
-    # Remove leading/trailing hyphens
-    text = text.strip("-")
+    # Normalize unicode and drop what has no ASCII form; ASCII is already normalized
+    if text.isascii():
+        raw = text.encode("ascii")
+    else:
+        raw = unicodedata.normalize("NFKD", text).encode("ascii", "ignore")
+    # Lowercase and blank out special chars in one table lookup per byte,
+    # then join the remaining runs with hyphens
+    text = "-".join(raw.translate(_SLUG_TABLE).decode("ascii").split())
     # Truncate
     if len(text) > max_length:
         text = text[:max_length].rsplit("-", 1)[0]
@@ -49,7 +74,7 @@ def get_article_path(
 ) -> Path:
     """Generate the storage path for an article.
 
-    Path format: library/<YYYY>/<MM>/<slug>/
+    Path format: library/<YYYY>/<MM>/<DD>/<slug>/
 
     Args:
         title: Article title for slug generation.
@@ -63,15 +88,16 @@ def get_article_path(
         settings = get_settings()
         base_dir = settings.library_dir
 
-    year = fetched_at.strftime("%Y")
-    month = fetched_at.strftime("%m")
+    year = f"{fetched_at.year:04d}"
+    month = f"{fetched_at.month:02d}"
+    day = f"{fetched_at.day:02d}"
     slug = slugify(title)
 
     # Add timestamp suffix to avoid collisions
-    timestamp_suffix = fetched_at.strftime("%H%M%S")
+    timestamp_suffix = f"{fetched_at.hour:02d}{fetched_at.minute:02d}{fetched_at.second:02d}"
     slug_with_time = f"{slug}-{timestamp_suffix}"
 
-    return base_dir / year / month / slug_with_time
+    return base_dir / year / month / day / slug_with_time
 
 
 def write_article(
@@ -97,36 +123,97 @@ def write_article(
         Path to the article directory.
     """
     article_dir = get_article_path(meta.title, meta.fetched_at, base_dir)
-    article_dir.mkdir(parents=True, exist_ok=True)
-
-    # Write meta.json
-    meta_file = article_dir / "meta.json"
-    with open(meta_file, "w", encoding="utf-8") as f:
-        json.dump(meta.model_dump(mode="json"), f, indent=2, default=str)
-    logger.debug(f"Wrote meta.json: {meta_file}")
-
-    # Write content.txt
-    content_file = article_dir / "content.txt"
-    with open(content_file, "w", encoding="utf-8") as f:
-        f.write(content)
-    logger.debug(f"Wrote content.txt: {content_file}")
-
-    # Write summary.md
-    summary_file = article_dir / "summary.md"
-    with open(summary_file, "w", encoding="utf-8") as f:
-        f.write(summary)
-    logger.debug(f"Wrote summary.md: {summary_file}")
+    article_dir.parent.mkdir(parents=True, exist_ok=True)
+
+    files = {
+        "meta.json": orjson.dumps(meta.model_dump(mode="json"), option=orjson.OPT_INDENT_2),
+        "content.txt": content.encode("utf-8"),
+        "summary.md": summary.encode("utf-8"),
+    }
+
+    # Stage the files in a sibling temp directory and rename it into place,
+    # so a crash never leaves a partially written article behind
+    staging_dir = article_dir.parent / (
+        f".{article_dir.name}.{os.getpid()}-{threading.get_ident()}.tmp"
+    )
+    staging_dir.mkdir(exist_ok=True)
+    try:
+        for name, data in files.items():
+            with open(staging_dir / name, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+                f.write(data)
+            logger.debug(f"Wrote {name}: {article_dir / name}")
+
+        try:
+            os.rename(staging_dir, article_dir)
+        except OSError:
+            if not article_dir.is_dir():
+                raise
+            # Same slug and second as an existing article: replace its files
+            for name in files:
+                os.replace(staging_dir / name, article_dir / name)
+            staging_dir.rmdir()
+    except BaseException:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        raise
 
     logger.info(f"Article saved to: {article_dir}")
     return article_dir
 
 
+def _is_day_dir_name(name: str) -> bool:
+    """Check whether a directory name under a month is a day directory."""
+    # Article directories always end in -HHMMSS, so they never look like this
+    return len(name) == 2 and name.isdigit()
+
+
+def _list_article_dirs(directory: Path, *, legacy: bool = False) -> list[os.DirEntry[str]]:
+    """List the article directories directly inside directory.
+
+    Args:
+        directory: Day directory, or month directory when legacy is set.
+        legacy: List articles stored directly under a month directory by the
+            old layout, skipping the day directories next to them.
+
+    Returns:
+        Directory entries, or an empty list if directory does not exist.
+    """
+    try:
+        # DirEntry.is_dir() answers from the directory listing without a stat
+        with os.scandir(directory) as it:
+            return [
+                entry
+                for entry in it
+                # Dot-prefixed directories are articles still being written
+                if not entry.name.startswith(".")
+                and not (legacy and _is_day_dir_name(entry.name))
+                and entry.is_dir()
+            ]
+    except FileNotFoundError:
+        return []
+
+
+def _read_article_meta(article_dir: str) -> Optional[ArticleMeta]:
+    """Read an article's meta.json, or None if it is missing or invalid."""
+    try:
+        # Parse and validate the raw bytes in one native pass
+        with open(os.path.join(article_dir, "meta.json"), "rb") as f:
+            return ArticleMeta.model_validate_json(f.read())
+    except FileNotFoundError:
+        return None
+    except ValueError as e:
+        logger.warning(f"Invalid meta.json in {article_dir}: {e}")
+        return None
+
+
 def load_articles_for_date(
     date: datetime,
     base_dir: Optional[Path] = None,
 ) -> list[tuple[ArticleMeta, Path]]:
     """Load all articles for a specific date.
 
+    Only the date's own day directory is read, plus any articles left
+    directly under the month by the old layout (see migrate_library_layout).
+
     Args:
         date: The date to load articles for.
         base_dir: Base library directory, uses config default if None.
@@ -138,34 +225,94 @@ def load_articles_for_date(
         settings = get_settings()
         base_dir = settings.library_dir
 
-    year = date.strftime("%Y")
-    month = date.strftime("%m")
+    month_dir = base_dir / f"{date.year:04d}" / f"{date.month:02d}"
+    target_date = date.date()
 
-    month_dir = base_dir / year / month
-    if not month_dir.exists():
-        return []
+    entries = _list_article_dirs(month_dir / f"{date.day:02d}")
+    entries += _list_article_dirs(month_dir, legacy=True)
 
-    articles = []
-    for article_dir in month_dir.iterdir():
-        if not article_dir.is_dir():
-            continue
+    paths = [entry.path for entry in entries]
+    if len(paths) >= _PARALLEL_MIN_ARTICLES:
+        # map keeps listing order, so digests do not depend on read timing
+        with ThreadPoolExecutor(max_workers=_META_READ_WORKERS) as pool:
+            metas = list(pool.map(_read_article_meta, paths))
+    else:
+        metas = [_read_article_meta(path) for path in paths]
 
-        meta_file = article_dir / "meta.json"
-        if not meta_file.exists():
-            continue
+    # Check if fetched on the target date
+    return [
+        (meta, Path(path))
+        for meta, path in zip(metas, paths)
+        if meta is not None and meta.fetched_at.date() == target_date
+    ]
 
-        try:
-            with open(meta_file, encoding="utf-8") as f:
-                meta_data = json.load(f)
-            meta = ArticleMeta.model_validate(meta_data)
 
-            # Check if fetched on the target date
-            if meta.fetched_at.date() == date.date():
-                articles.append((meta, article_dir))
-        except (json.JSONDecodeError, ValueError) as e:
-            logger.warning(f"Invalid meta.json in {article_dir}: {e}")
+def migrate_library_layout(base_dir: Optional[Path] = None) -> int:
+    """Move articles from library/<YYYY>/<MM>/ into per-day directories.
+
+    Articles written before day directories were introduced are moved to
+    library/<YYYY>/<MM>/<DD>/ based on their meta.json. Safe to run again.
+
+    Args:
+        base_dir: Base library directory, uses config default if None.
 
-    return articles
+    Returns:
+        Number of article directories moved.
+    """
+    if base_dir is None:
+        settings = get_settings()
+        base_dir = settings.library_dir
+
+    moved = 0
+    for year_dir in sorted(base_dir.glob("[0-9][0-9][0-9][0-9]")):
+        for month_dir in sorted(year_dir.glob("[0-9][0-9]")):
+            for entry in _list_article_dirs(month_dir, legacy=True):
+                meta = _read_article_meta(entry.path)
+                if meta is None:
+                    logger.warning(f"Not migrating {entry.path}: no valid meta.json")
+                    continue
+
+                day_dir = month_dir / f"{meta.fetched_at.day:02d}"
+                target = day_dir / entry.name
+                if target.exists():
+                    logger.warning(f"Not migrating {entry.path}: {target} already exists")
+                    continue
+                day_dir.mkdir(exist_ok=True)
+                os.rename(entry.path, target)
+                moved += 1
+                logger.debug(f"Migrated {entry.path} -> {target}")
+
+    logger.info(f"Migrated {moved} articles to per-day directories")
+    return moved
+
+
+def _extract_tldr(summary_file: Path) -> Optional[str]:
+    """Read the TL;DR section of a summary file.
+
+    Lines are read only up to the end of the section, which sits near the
+    top of generated summaries.
+
+    Args:
+        summary_file: Path to summary.md.
+
+    Returns:
+        The section text, or None if the file or section is missing or empty.
+    """
+    collected: list[str] = []
+    in_section = False
+    try:
+        with open(summary_file, encoding="utf-8") as f:
+            for line in f:
+                if not in_section:
+                    in_section = line.startswith(_TLDR_HEADING)
+                elif line.startswith(("##", "---")):
+                    break
+                else:
+                    collected.append(line)
+    except FileNotFoundError:
+        return None
+
+    return "".join(collected).strip() or None
 
 
 def generate_digest(
@@ -227,40 +374,27 @@ def generate_digest(
             summary_file = article_dir / "summary.md"
 
             # Read TL;DR from summary if available
-            tldr = "Summary not available."
-            if summary_file.exists():
-                with open(summary_file, encoding="utf-8") as f:
-                    summary_content = f.read()
-                # Extract TL;DR section
-                if "## TL;DR" in summary_content:
-                    tldr_match = re.search(
-                        r"## TL;DR\s*\n(.+?)(?=\n##|\n---|\Z)",
-                        summary_content,
-                        re.DOTALL,
-                    )
-                    if tldr_match:
-                        tldr = tldr_match.group(1).strip()
-
-            lines.extend([
-                f"### {meta.title}",
-                "",
-                f"- **URL**: [{meta.url}]({meta.url})",
-                f"- **Words**: {meta.word_count:,}",
-                f"- **Source**: {meta.source.value}",
-                f"- **Tags**: {', '.join(meta.tags) if meta.tags else 'none'}",
-                "",
-                f"**Summary**: {tldr}",
-                "",
-                f"[Read full summary]({summary_file.relative_to(output_dir.parent)})",
-                "",
-                "---",
-                "",
-            ])
+            tldr = _extract_tldr(summary_file) or "Summary not available."
+
+            # One block per article rather than a temporary list of its lines
+            lines.append(
+                f"### {meta.title}\n"
+                "\n"
+                f"- **URL**: [{meta.url}]({meta.url})\n"
+                f"- **Words**: {meta.word_count:,}\n"
+                f"- **Source**: {meta.source.value}\n"
+                f"- **Tags**: {', '.join(meta.tags) if meta.tags else 'none'}\n"
+                "\n"
+                f"**Summary**: {tldr}\n"
+                "\n"
+                f"[Read full summary]({summary_file.relative_to(output_dir.parent)})\n"
+                "\n"
+                "---\n"
+            )
 
     # Write digest file
     digest_file = output_dir / f"{date_str}.md"
-    with open(digest_file, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+    digest_file.write_bytes("\n".join(lines).encode("utf-8"))
 
     logger.info(f"Generated digest: {digest_file}")
     return digest_file
@@ -279,8 +413,8 @@ def create_seen_record(
 
     Args:
         url: Original URL.
-        url_hash: SHA256 hash of normalized URL.
-        content_hash: SHA256 hash of content.
+        url_hash: Hash of the normalized URL (compute_url_hash).
+        content_hash: Hash of the normalized content (compute_content_hash).
         title: Article title.
         stored_path: Path where article was stored.
         source: How the article was ingested.
@@ -292,6 +426,8 @@ def create_seen_record(
     if fetched_at is None:
         fetched_at = datetime.now()
 
+    # The validating constructor runs in pydantic-core and is faster than
+    # SeenRecord.model_construct, which builds the instance in Python
     return SeenRecord(
         url=url,
         url_hash=url_hash,
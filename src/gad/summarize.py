@@ -1,15 +1,28 @@
 """Summarization module for GAD."""
 
+import asyncio
+import hashlib
 import logging
+import os
 from abc import ABC, abstractmethod
-from typing import Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+import orjson
 
 from gad.config import get_settings
 
+# openai is imported when an OpenAISummarizer is created; only its types are needed here
+if TYPE_CHECKING:
+    from openai.types.chat import ChatCompletionMessageParam
+
 
 logger = logging.getLogger(__name__)
 
 
+# Bump whenever SUMMARY_PROMPT changes so cached summaries are regenerated
+SUMMARY_PROMPT_VERSION = "1"
+
 # Summarization prompt template
 SUMMARY_PROMPT = """You are a skilled research assistant. Your task is to summarize the following article accurately and comprehensively.
 
@@ -65,6 +78,21 @@ class Summarizer(ABC):
         """
         pass
 
+    async def summarize_async(self, text: str, title: Optional[str] = None) -> str:
+        """Generate a summary without blocking the event loop.
+
+        The default runs :meth:`summarize` in a worker thread; subclasses with a
+        native async client override this.
+
+        Args:
+            text: The article text to summarize.
+            title: Optional title for context.
+
+        Returns:
+            Markdown-formatted summary.
+        """
+        return await asyncio.to_thread(self.summarize, text, title)
+
 
 class MockSummarizer(Summarizer):
     """Mock summarizer for testing without API calls."""
@@ -151,25 +179,18 @@ class OpenAISummarizer(Summarizer):
 
         # Import here to avoid requiring openai when not used
         try:
-            from openai import OpenAI
+            from openai import AsyncOpenAI, OpenAI
 
             self.client = OpenAI(api_key=api_key)
+            self.async_client = AsyncOpenAI(api_key=api_key)
         except ImportError:
             raise ImportError(
                 "openai package is required for OpenAI summarization. "
                 "Install with: pip install openai"
             )
 
-    def summarize(self, text: str, title: Optional[str] = None) -> str:
-        """Generate a summary using OpenAI API.
-
-        Args:
-            text: The article text to summarize.
-            title: Optional title for context.
-
-        Returns:
-            Markdown-formatted summary.
-        """
+    def _build_messages(self, text: str) -> "list[ChatCompletionMessageParam]":
+        """Build the chat messages for an article, truncating overlong input."""
         settings = get_settings()
 
         # Truncate if too long
@@ -180,35 +201,176 @@ class OpenAISummarizer(Summarizer):
             text = text[: settings.max_input_chars] + "\n\n[Content truncated...]"
 
         prompt = SUMMARY_PROMPT.format(text=text)
+        return [
+            {
+                "role": "system",
+                "content": "You are a helpful research assistant that creates accurate, well-structured summaries.",
+            },
+            {"role": "user", "content": prompt},
+        ]
+
+    @staticmethod
+    def _finish_summary(summary: str, title: Optional[str]) -> str:
+        """Add a title header to the model output if provided."""
+        if title and not summary.startswith(f"# {title}"):
+            summary = f"# Summary: {title}\n\n{summary}"
+        return summary
+
+    def summarize(self, text: str, title: Optional[str] = None) -> str:
+        """Generate a summary using OpenAI API.
+
+        Args:
+            text: The article text to summarize.
+            title: Optional title for context.
+
+        Returns:
+            Markdown-formatted summary.
+        """
+        messages = self._build_messages(text)
 
         try:
             logger.info(f"Calling OpenAI API with model {self.model}")
             response = self.client.chat.completions.create(
                 model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a helpful research assistant that creates accurate, well-structured summaries.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
+                messages=messages,
                 temperature=0.3,  # Lower temperature for more factual output
                 max_tokens=2000,
             )
+            return self._finish_summary(response.choices[0].message.content or "", title)
 
-            summary = response.choices[0].message.content or ""
+        except Exception as e:
+            logger.error(f"OpenAI API error: {e}")
+            raise RuntimeError(f"Failed to generate summary: {e}") from e
 
-            # Add title header if provided
-            if title and not summary.startswith(f"# {title}"):
-                summary = f"# Summary: {title}\n\n{summary}"
+    async def summarize_async(self, text: str, title: Optional[str] = None) -> str:
+        """Generate a summary using the async OpenAI client.
 
-            return summary
+        Args:
+            text: The article text to summarize.
+            title: Optional title for context.
+
+        Returns:
+            Markdown-formatted summary.
+        """
+        messages = self._build_messages(text)
+
+        try:
+            logger.info(f"Calling OpenAI API with model {self.model}")
+            response = await self.async_client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=0.3,  # Lower temperature for more factual output
+                max_tokens=2000,
+            )
+            return self._finish_summary(response.choices[0].message.content or "", title)
 
         except Exception as e:
             logger.error(f"OpenAI API error: {e}")
             raise RuntimeError(f"Failed to generate summary: {e}") from e
 
 
+def _summary_cache_file(
+    summarizer: Summarizer, title: Optional[str], content_hash: str
+) -> Path:
+    """Return the cache file path for a summary of the given content."""
+    settings = get_settings()
+    key_parts = [
+        content_hash,
+        type(summarizer).__name__,
+        getattr(summarizer, "model", ""),
+        SUMMARY_PROMPT_VERSION,
+        str(settings.max_input_chars),
+        title or "",
+    ]
+    key = hashlib.sha256("\x1f".join(key_parts).encode("utf-8")).hexdigest()
+    return settings.cache_dir / "summaries" / f"{key}.json"
+
+
+def _read_cached_summary(cache_file: Path) -> Optional[str]:
+    """Return a cached summary, or None on a miss or unreadable entry."""
+    try:
+        cached = orjson.loads(cache_file.read_bytes())
+        logger.debug(f"Summary cache hit: {cache_file.name}")
+        return str(cached["summary"])
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Ignoring unreadable summary cache entry {cache_file}: {e}")
+    return None
+
+
+def _write_cached_summary(cache_file: Path, summarizer: Summarizer, summary: str) -> None:
+    """Store a summary in the cache."""
+    # Write to a temp file and rename so readers never see a partial entry
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_bytes(
+            orjson.dumps({"model": getattr(summarizer, "model", ""), "summary": summary})
+        )
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logger.warning(f"Could not cache summary: {e}")
+
+
+def cached_summarize(
+    summarizer: Summarizer,
+    text: str,
+    title: Optional[str],
+    content_hash: str,
+) -> str:
+    """Summarize text, reusing a cached summary of identical content if present.
+
+    Summaries are stored under ``<output_dir>/cache/summaries/`` keyed by the
+    content hash, summarizer, model, prompt version, input limit and title, so
+    any change that would alter the summary misses the cache.
+
+    Args:
+        summarizer: Summarizer to call on a cache miss.
+        text: The article text to summarize.
+        title: Optional title for context.
+        content_hash: Hash of the normalized content (compute_content_hash).
+
+    Returns:
+        Markdown-formatted summary.
+    """
+    cache_file = _summary_cache_file(summarizer, title, content_hash)
+    cached = _read_cached_summary(cache_file)
+    if cached is not None:
+        return cached
+
+    summary = summarizer.summarize(text, title)
+    _write_cached_summary(cache_file, summarizer, summary)
+    return summary
+
+
+async def cached_summarize_async(
+    summarizer: Summarizer,
+    text: str,
+    title: Optional[str],
+    content_hash: str,
+) -> str:
+    """Async variant of :func:`cached_summarize` sharing the same cache.
+
+    Args:
+        summarizer: Summarizer to call on a cache miss.
+        text: The article text to summarize.
+        title: Optional title for context.
+        content_hash: Hash of the normalized content (compute_content_hash).
+
+    Returns:
+        Markdown-formatted summary.
+    """
+    cache_file = _summary_cache_file(summarizer, title, content_hash)
+    cached = await asyncio.to_thread(_read_cached_summary, cache_file)
+    if cached is not None:
+        return cached
+
+    summary = await summarizer.summarize_async(text, title)
+    await asyncio.to_thread(_write_cached_summary, cache_file, summarizer, summary)
+    return summary
+
+
 def get_summarizer() -> Summarizer:
     """Get the appropriate summarizer based on configuration.
 
@@ -5,8 +5,10 @@ from pathlib import Path
 from typing import Generator
 
 import pytest
+from bs4 import BeautifulSoup
 
 from gad.config import Settings, reset_settings
+from gad.extract import parse_html
 
 
 @pytest.fixture
@@ -30,7 +32,7 @@ def test_settings(temp_data_dir: Path) -> Generator[Settings, None, None]:
     reset_settings()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_html() -> str:
     """Sample HTML content for extraction tests."""
     return """
@@ -58,7 +60,13 @@ def sample_html() -> str:
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_soup(sample_html: str) -> BeautifulSoup:
+    """sample_html parsed once per session; read-only, as tests share it."""
+    return parse_html(sample_html)
+
+
+@pytest.fixture(scope="session")
 def sample_text() -> str:
     """Sample extracted text content."""
     return """
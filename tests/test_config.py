@@ -0,0 +1,79 @@
+"""Tests for configuration loading."""
+
+import os
+from pathlib import Path
+from typing import Generator
+
+import pytest
+
+from gad.config import get_settings, load_settings, load_yaml_config, reset_settings
+
+
+@pytest.fixture
+def config_dir(temp_data_dir: Path, monkeypatch: pytest.MonkeyPatch) -> Generator[Path, None, None]:
+    """Run the test from an empty directory with no user config or GAD_* overrides."""
+    for name in list(os.environ):
+        if name.startswith("GAD_"):
+            monkeypatch.delenv(name)
+    monkeypatch.setenv("HOME", str(temp_data_dir / "home"))
+    monkeypatch.chdir(temp_data_dir)
+    reset_settings()
+    yield temp_data_dir
+    reset_settings()
+
+
+def write_config(path: Path, model: str, mtime_ns: int) -> None:
+    """Write a settings file naming model, with a fixed modification time."""
+    path.write_text(
+        f"model: {model}\ndefault_tags: [a, b]\nhttp:\n  timeout: 5\n", encoding="utf-8"
+    )
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TestLoadYamlConfig:
+    """Tests for the parsed-config cache."""
+
+    def test_edit_picked_up(self, config_dir: Path) -> None:
+        """Should reparse settings.yaml once its modification time changes."""
+        config_file = config_dir / "settings.yaml"
+        write_config(config_file, "model-a", 1_000_000_000_000_000_000)
+        assert load_settings().model == "model-a"
+
+        write_config(config_file, "model-b", 1_000_000_001_000_000_000)
+        assert load_settings().model == "model-b"
+
+    def test_result_not_shared(self, config_dir: Path) -> None:
+        """Should return a fresh dict that callers can modify safely."""
+        config_file = config_dir / "settings.yaml"
+        write_config(config_file, "model-a", 1_000_000_000_000_000_000)
+
+        first = load_yaml_config(config_file)
+        first["model"] = "changed"
+        first["default_tags"].append("c")
+        first["http"]["timeout"] = 99
+
+        assert load_yaml_config(config_file) == {
+            "model": "model-a",
+            "default_tags": ["a", "b"],
+            "http": {"timeout": 5},
+        }
+        assert load_settings().http.timeout == 5
+
+    def test_missing_file(self, config_dir: Path) -> None:
+        """Should fall back to defaults when no config file exists."""
+        assert load_yaml_config() == {}
+        assert load_yaml_config(config_dir / "missing.yaml") == {}
+
+
+class TestResetSettings:
+    """Tests for reloading the global settings."""
+
+    def test_forces_reload(self, config_dir: Path) -> None:
+        """Should find a config file created after settings were first loaded."""
+        assert get_settings().model == "gpt-4o-mini"
+
+        write_config(config_dir / "settings.yaml", "model-a", 1_000_000_000_000_000_000)
+        assert get_settings().model == "gpt-4o-mini"
+
+        reset_settings()
+        assert get_settings().model == "model-a"
@@ -1,12 +1,17 @@
 """Tests for deduplication logic."""
 
+import hashlib
 import json
 from datetime import datetime
 from pathlib import Path
+from typing import Callable
 
 import pytest
 
+import gad.dedup
 from gad.dedup import (
+    BloomFilter,
+    SeenWriter,
     compute_content_hash,
     compute_url_hash,
     is_duplicate,
@@ -18,6 +23,20 @@ from gad.dedup import (
 from gad.models import SeenRecord, SourceType
 
 
+def make_seen_record(i: int) -> SeenRecord:
+    """Build a seen record for https://example.com/<i>."""
+    url = f"https://example.com/{i}"
+    return SeenRecord(
+        url=url,
+        url_hash=compute_url_hash(url),
+        content_hash=compute_content_hash(f"Article body {i}"),
+        title=f"Article {i}",
+        fetched_at=datetime(2024, 1, 1),
+        stored_path=f"library/2024/01/{i}",
+        source=SourceType.MANUAL,
+    )
+
+
 class TestNormalizeUrl:
     """Tests for URL normalization."""
 
@@ -53,6 +72,21 @@ class TestNormalizeUrl:
         normalized = normalize_url(url)
         assert normalized == "https://example.com/article?a=2&m=3&z=1"
 
+    def test_sort_query_parameters_by_key(self) -> None:
+        """Should order parameters by key, then value."""
+        url = "https://example.com/article?a-b=1&a=2&a=1"
+        normalized = normalize_url(url)
+        assert normalized == "https://example.com/article?a=1&a=2&a-b=1"
+
+    def test_canonical_url_unchanged(self) -> None:
+        """Should return already-canonical URLs as-is."""
+        url = "https://example.com/2024/01/Some-Article"
+        assert normalize_url(url) == url
+
+    def test_params_dropped(self) -> None:
+        """Should drop path params even when the rest is canonical."""
+        assert normalize_url("https://example.com/a;jsessionid=1") == "https://example.com/a"
+
     def test_remove_default_port_http(self) -> None:
         """Should remove default port 80 for HTTP."""
         url = "http://example.com:80/article"
@@ -121,6 +155,11 @@ class TestComputeHashes:
         hash2 = compute_content_hash(text2)
         assert hash1 == hash2
 
+    def test_hash_is_64_bit_prefix(self) -> None:
+        """Should keep the first 64 bits of the SHA256 digest as hex."""
+        full = hashlib.sha256(b"https://example.com/article").hexdigest()
+        assert compute_url_hash("https://example.com/article") == full[:16]
+
 
 class TestSeenRecords:
     """Tests for seen.jsonl operations."""
@@ -170,6 +209,48 @@ class TestSeenRecords:
         assert "hash0" in records
         assert "hash1" in records
 
+    def test_reload_after_append(self, temp_data_dir: Path) -> None:
+        """Should include records appended after the file was first loaded."""
+        seen_file = temp_data_dir / "seen.jsonl"
+
+        for i in range(2):
+            record = SeenRecord(
+                url=f"https://example.com/article{i}",
+                url_hash=f"hash{i}",
+                content_hash=f"content{i}",
+                title=f"Article {i}",
+                fetched_at=datetime.now(),
+                stored_path=f"library/2024/01/article-{i}",
+                source=SourceType.MANUAL,
+            )
+            with open(seen_file, "a", encoding="utf-8") as f:
+                f.write(record.model_dump_json() + "\n")
+            records = load_seen_records(seen_file)
+            assert len(records) == i + 1
+
+        # Returned dicts are copies of the cache
+        records.clear()
+        assert len(load_seen_records(seen_file)) == 2
+
+    def test_skip_invalid_lines(self, temp_data_dir: Path) -> None:
+        """Should skip lines that are not JSON or lack the hashes."""
+        seen_file = temp_data_dir / "seen.jsonl"
+        record = SeenRecord(
+            url="https://example.com/article",
+            url_hash="hash0",
+            content_hash="content0",
+            title="Article",
+            fetched_at=datetime.now(),
+            stored_path="library/2024/01/article",
+            source=SourceType.MANUAL,
+        )
+        seen_file.write_text(
+            'not json\n{"url": "https://example.com/other"}\n' + record.model_dump_json() + "\n",
+            encoding="utf-8",
+        )
+
+        assert load_seen_records(seen_file) == {"hash0": record}
+
     def test_load_empty_file(self, temp_data_dir: Path) -> None:
         """Should return empty dict for non-existent file."""
         seen_file = temp_data_dir / "seen.jsonl"
@@ -239,3 +320,332 @@ class TestIsDuplicate:
         )
         assert is_dup
         assert "matches existing" in reason.lower()
+
+    def test_precomputed_hashes(self, temp_data_dir: Path) -> None:
+        """Should check the given hashes instead of recomputing them."""
+        seen_file = temp_data_dir / "seen.jsonl"
+
+        record = SeenRecord(
+            url="https://example.com/original",
+            url_hash="precomputedhash",
+            content_hash="somehash",
+            title="Original Article",
+            fetched_at=datetime.now(),
+            stored_path="library/2024/01/original",
+            source=SourceType.MANUAL,
+        )
+        record_seen(record, seen_file)
+
+        is_dup, _ = is_duplicate(
+            "https://example.com/other", None, seen_file, url_hash="precomputedhash"
+        )
+        assert is_dup
+
+    def test_duplicate_in_pretty_json_line(self, temp_data_dir: Path) -> None:
+        """Should find records written with spaces after separators."""
+        seen_file = temp_data_dir / "seen.jsonl"
+
+        url = "https://example.com/article"
+        record = SeenRecord(
+            url=url,
+            url_hash=compute_url_hash(url),
+            content_hash="somehash",
+            title="Hand Written",
+            fetched_at=datetime.now(),
+            stored_path="library/2024/01/hand-written",
+            source=SourceType.MANUAL,
+        )
+        seen_file.write_text(json.dumps(record.model_dump(mode="json")) + "\n")
+
+        is_dup, reason = is_duplicate(url, None, seen_file)
+        assert is_dup
+        assert reason is not None and "Hand Written" in reason
+
+    def test_duplicate_of_legacy_full_hash(self, temp_data_dir: Path) -> None:
+        """Should match records written with full 64-character hashes."""
+        seen_file = temp_data_dir / "seen.jsonl"
+
+        url = "https://example.com/article"
+        content = "Legacy article content"
+        record = SeenRecord(
+            url=url,
+            url_hash=hashlib.sha256(normalize_url(url).encode()).hexdigest(),
+            content_hash=hashlib.sha256(normalize_text(content).encode()).hexdigest(),
+            title="Legacy",
+            fetched_at=datetime.now(),
+            stored_path="library/2024/01/legacy",
+            source=SourceType.MANUAL,
+        )
+        record_seen(record, seen_file)
+
+        assert is_duplicate(url, None, seen_file)[0]
+        assert is_duplicate("https://example.com/moved", content, seen_file)[0]
+        assert compute_url_hash(url) in load_seen_records(seen_file)
+
+
+class TestSeenWriter:
+    """Tests for batched appends through SeenWriter."""
+
+    def test_duplicate_after_write(self, temp_data_dir: Path) -> None:
+        """Should report records written in the same process as duplicates."""
+        seen_file = temp_data_dir / "seen.jsonl"
+        record_seen(make_seen_record(0), seen_file)
+        assert is_duplicate("https://example.com/0", None, seen_file)[0]
+        bloom = gad.dedup._BLOOMS[seen_file][1]
+        index = gad.dedup._SEEN_CACHE[seen_file][1]
+
+        records = [make_seen_record(1), make_seen_record(2)]
+        with SeenWriter(seen_file) as writer:
+            for record in records:
+                writer.write(record)
+                assert is_duplicate(record.url, None, seen_file)[0]
+
+        for record in records:
+            assert is_duplicate(
+                "https://other.example.com/", None, seen_file, content_hash=record.content_hash
+            ) == (True, f"Content matches existing: {record.title}")
+        # The cached filter and records were extended, not rebuilt
+        assert gad.dedup._BLOOMS[seen_file][1] is bloom
+        assert gad.dedup._SEEN_CACHE[seen_file][1] is index
+        assert bloom.count == 6
+        assert len(load_seen_records(seen_file)) == 3
+
+    def test_lines_on_disk_before_close(self, temp_data_dir: Path) -> None:
+        """Should flush each record so other readers see it while the file is open."""
+        seen_file = temp_data_dir / "seen.jsonl"
+        record = make_seen_record(0)
+
+        with SeenWriter(seen_file) as writer:
+            writer.write(record)
+            assert seen_file.read_bytes() == record.model_dump_jsonl()
+
+
+class TestBloomFilter:
+    """Tests for the Bloom filter used to pre-screen duplicates."""
+
+    def test_added_keys_are_members(self) -> None:
+        """Should never report a false negative."""
+        bloom = BloomFilter(capacity=1000, error_rate=1e-3)
+        keys = [compute_url_hash(f"https://example.com/{i}") for i in range(500)]
+        for key in keys:
+            bloom.add(key)
+        assert all(key in bloom for key in keys)
+
+    def test_missing_key_not_member(self) -> None:
+        """Should report keys that were never added as absent."""
+        bloom = BloomFilter(capacity=1000, error_rate=1e-3)
+        bloom.add(compute_url_hash("https://example.com/a"))
+        assert compute_url_hash("https://example.com/b") not in bloom
+
+    def test_non_hex_keys(self) -> None:
+        """Should accept keys that are not hex digests."""
+        bloom = BloomFilter(capacity=100, error_rate=1e-3)
+        bloom.add("not-a-hash")
+        assert "not-a-hash" in bloom
+
+    def test_duplicate_after_record_seen(self, temp_data_dir: Path) -> None:
+        """Should see records appended after the filter was built."""
+        seen_file = temp_data_dir / "seen.jsonl"
+        url = "https://example.com/article"
+
+        # Builds the (empty) filter
+        assert is_duplicate(url, None, seen_file) == (False, None)
+
+        record = SeenRecord(
+            url=url,
+            url_hash=compute_url_hash(url),
+            content_hash="somehash",
+            title="Existing Article",
+            fetched_at=datetime.now(),
+            stored_path="library/2024/01/existing",
+            source=SourceType.MANUAL,
+        )
+        record_seen(record, seen_file)
+
+        is_dup, _ = is_duplicate(url, None, seen_file)
+        assert is_dup
+
+    def test_duplicate_after_external_append(self, temp_data_dir: Path) -> None:
+        """Should rebuild the filter when seen.jsonl changes on disk."""
+        seen_file = temp_data_dir / "seen.jsonl"
+        url = "https://example.com/article"
+        seen_file.write_text("", encoding="utf-8")
+
+        assert is_duplicate(url, None, seen_file) == (False, None)
+
+        record = SeenRecord(
+            url=url,
+            url_hash=compute_url_hash(url),
+            content_hash="somehash",
+            title="Existing Article",
+            fetched_at=datetime.now(),
+            stored_path="library/2024/01/existing",
+            source=SourceType.MANUAL,
+        )
+        with open(seen_file, "a", encoding="utf-8") as f:
+            f.write(record.model_dump_json() + "\n")
+
+        is_dup, _ = is_duplicate(url, None, seen_file)
+        assert is_dup
+
+    def test_restored_from_seen_index(self, temp_data_dir: Path) -> None:
+        """Should persist the filter and extend it with lines appended later."""
+        seen_file = temp_data_dir / "seen.jsonl"
+        records = [
+            SeenRecord(
+                url=f"https://example.com/{i}",
+                url_hash=compute_url_hash(f"https://example.com/{i}"),
+                content_hash=f"content{i}",
+                title=f"Article {i}",
+                fetched_at=datetime.now(),
+                stored_path=f"library/2024/01/{i}",
+                source=SourceType.MANUAL,
+            )
+            for i in range(2)
+        ]
+        record_seen(records[0], seen_file)
+        assert is_duplicate("https://example.com/0", None, seen_file)[0]
+        assert (temp_data_dir / "seen.idx").exists()
+
+        # A new process restores seen.idx and scans only the appended line
+        gad.dedup._BLOOMS.clear()
+        with open(seen_file, "ab") as f:
+            f.write(records[1].model_dump_jsonl())
+        assert is_duplicate("https://example.com/0", None, seen_file)[0]
+        assert is_duplicate("https://example.com/1", None, seen_file)[0]
+
+    def test_seen_index_ignored_after_rewrite(self, temp_data_dir: Path) -> None:
+        """Should rebuild the filter when seen.jsonl was rewritten."""
+        seen_file = temp_data_dir / "seen.jsonl"
+
+        def write(url: str) -> None:
+            record = SeenRecord(
+                url=url,
+                url_hash=compute_url_hash(url),
+                content_hash="somehash",
+                title="Article",
+                fetched_at=datetime(2024, 1, 1),
+                stored_path="library/2024/01/article",
+                source=SourceType.MANUAL,
+            )
+            seen_file.write_bytes(record.model_dump_jsonl())
+
+        write("https://example.com/a")
+        assert is_duplicate("https://example.com/a", None, seen_file)[0]
+
+        # Same size, different record: the stale index must not hide it
+        gad.dedup._BLOOMS.clear()
+        write("https://example.com/b")
+        assert is_duplicate("https://example.com/b", None, seen_file)[0]
+
+    def test_sized_from_seen_records(self, temp_data_dir: Path) -> None:
+        """Should size the filter from seen.jsonl rather than a fixed capacity."""
+        seen_file = temp_data_dir / "seen.jsonl"
+        record_seen(make_seen_record(0), seen_file)
+
+        bloom = gad.dedup._get_bloom(seen_file)
+
+        assert bloom.capacity == gad.dedup._BLOOM_MIN_CAPACITY
+        assert bloom.count == 2
+        assert (temp_data_dir / "seen.idx").stat().st_size < 64 * 1024
+
+    def test_rebuilt_larger_when_full(
+        self, temp_data_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Should rebuild the filter at a larger size once it passes capacity."""
+        monkeypatch.setattr(gad.dedup, "_BLOOM_MIN_CAPACITY", 4)
+        seen_file = temp_data_dir / "seen.jsonl"
+        record_seen(make_seen_record(0), seen_file)
+        assert gad.dedup._get_bloom(seen_file).capacity == 4
+
+        for i in range(1, 4):
+            record_seen(make_seen_record(i), seen_file)
+        bloom = gad.dedup._get_bloom(seen_file)
+
+        assert bloom.capacity == 16
+        assert bloom.count == 8
+        for i in range(4):
+            assert is_duplicate(f"https://example.com/{i}", None, seen_file)[0]
+
+        # The larger size is recorded in seen.idx for the next process
+        gad.dedup._BLOOMS.clear()
+        assert gad.dedup._get_bloom(seen_file).capacity == 16
+
+
+class TestBloomIndex:
+    """Tests for persisting the Bloom filter in seen.idx."""
+
+    def test_round_trip(self, temp_data_dir: Path) -> None:
+        """Should restore the filter, its size and the covered byte count."""
+        seen_file = temp_data_dir / "seen.jsonl"
+        record_seen(make_seen_record(0), seen_file)
+        bloom = gad.dedup._get_bloom(seen_file)
+
+        loaded = gad.dedup._load_bloom_index(seen_file)
+
+        assert loaded is not None
+        restored, covered = loaded
+        assert covered == seen_file.stat().st_size
+        assert restored.to_bytes() == bloom.to_bytes()
+        assert (restored.num_bits, restored.num_hashes) == (bloom.num_bits, bloom.num_hashes)
+        assert (restored.capacity, restored.count) == (bloom.capacity, bloom.count)
+
+    def test_truncated_seen_file_rebuilds(self, temp_data_dir: Path) -> None:
+        """Should rebuild rather than keep bits for records that were removed."""
+        seen_file = temp_data_dir / "seen.jsonl"
+        first, second = make_seen_record(0), make_seen_record(1)
+        record_seen(first, seen_file)
+        record_seen(second, seen_file)
+        gad.dedup._get_bloom(seen_file)
+
+        seen_file.write_bytes(first.model_dump_jsonl())
+        gad.dedup._BLOOMS.clear()
+
+        assert gad.dedup._load_bloom_index(seen_file) is None
+        bloom = gad.dedup._get_bloom(seen_file)
+        assert first.url_hash in bloom
+        assert second.url_hash not in bloom
+        assert bloom.count == 2
+
+    def test_rewritten_seen_file_rebuilds(self, temp_data_dir: Path) -> None:
+        """Should rebuild when the covered bytes no longer match the digest."""
+        seen_file = temp_data_dir / "seen.jsonl"
+        first, second = make_seen_record(0), make_seen_record(1)
+        record_seen(first, seen_file)
+        gad.dedup._get_bloom(seen_file)
+
+        # Same length, different record, so only the digest can tell
+        seen_file.write_bytes(second.model_dump_jsonl())
+        assert seen_file.stat().st_size == len(first.model_dump_jsonl())
+        gad.dedup._BLOOMS.clear()
+
+        assert gad.dedup._load_bloom_index(seen_file) is None
+        bloom = gad.dedup._get_bloom(seen_file)
+        assert second.url_hash in bloom
+        assert first.url_hash not in bloom
+
+    @pytest.mark.parametrize(
+        "corrupt",
+        [
+            lambda raw: b"",
+            lambda raw: raw[:10],
+            lambda raw: b"NOTBLOOM" + raw[8:],
+            lambda raw: raw[: gad.dedup._BLOOM_INDEX_HEADER.size + 1],
+        ],
+        ids=["empty", "short-header", "bad-magic", "short-bits"],
+    )
+    def test_corrupt_index_ignored(
+        self, temp_data_dir: Path, corrupt: Callable[[bytes], bytes]
+    ) -> None:
+        """Should ignore a corrupt seen.idx and write a valid one in its place."""
+        seen_file = temp_data_dir / "seen.jsonl"
+        record = make_seen_record(0)
+        record_seen(record, seen_file)
+        gad.dedup._get_bloom(seen_file)
+        index_file = temp_data_dir / "seen.idx"
+        index_file.write_bytes(corrupt(index_file.read_bytes()))
+        gad.dedup._BLOOMS.clear()
+
+        assert gad.dedup._load_bloom_index(seen_file) is None
+        assert record.url_hash in gad.dedup._get_bloom(seen_file)
+        assert gad.dedup._load_bloom_index(seen_file) is not None
@@ -0,0 +1,135 @@
+"""Tests for digest pre-ranking."""
+
+import random
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+import gad.digest
+from gad.digest import _content_length_score, _freshness_score, _source_weight, pre_rank
+from gad.models import DigestItemInput
+
+
+def make_items(count: int, seed: int = 0) -> list[DigestItemInput]:
+    """Build items with many tied scores."""
+    rng = random.Random(seed)
+    sources = ["openai", "arxiv", "github", "reddit", None]
+    return [
+        DigestItemInput(
+            title=f"Item {i}",
+            url=f"https://example.com/{i}",
+            source=rng.choice(sources),
+            date=rng.choice(["2024-01-01", None]),
+            content="x" * rng.choice([50, 800, 3000, 6000]),
+        )
+        for i in range(count)
+    ]
+
+
+class TestSourceWeight:
+    """Tests for source weighting."""
+
+    def test_host_label(self) -> None:
+        """Should weight by the site's domain label."""
+        item = DigestItemInput(title="T", url="https://blog.github.com/post")
+        assert _source_weight(item) == 3
+
+    def test_host_takes_precedence(self) -> None:
+        """Should prefer the host over source names mentioned in the path."""
+        item = DigestItemInput(title="T", url="https://techcrunch.com/openai-launch")
+        assert _source_weight(item) == 3
+
+    def test_source_name_fallback(self) -> None:
+        """Should fall back to matching the source name."""
+        item = DigestItemInput(
+            title="T", url="https://news.ycombinator.com/item?id=1", source="Hacker News"
+        )
+        assert _source_weight(item) == 2
+
+    def test_unknown_source(self) -> None:
+        """Should give unknown sources a neutral weight."""
+        item = DigestItemInput(title="T", url="https://example.org/post")
+        assert _source_weight(item) == 2
+
+
+class TestFreshnessScore:
+    """Tests for freshness scoring."""
+
+    NOW = datetime(2024, 3, 10, 12, 0, 0)
+
+    @pytest.mark.parametrize(
+        "date,expected",
+        [
+            ("2024-03-10", 5.0),
+            ("2024-03-08T09:00:00Z", 4.0),
+            ("2024-03-05T09:00:00+02:00", 3.0),
+            ("2023-01-01", 1.0),
+        ],
+    )
+    def test_iso_dates(self, date: str, expected: float) -> None:
+        """Should score ISO dates and datetimes by age."""
+        item = DigestItemInput(title="T", url="https://example.com", date=date)
+        assert _freshness_score(item, self.NOW) == expected
+
+    def test_unparseable_date(self) -> None:
+        """Should give undated or unparseable items a neutral score."""
+        for date in (None, "Sun, 10 Mar 2024 12:00:00 GMT"):
+            item = DigestItemInput(title="T", url="https://example.com", date=date)
+            assert _freshness_score(item, self.NOW) == 2.0
+
+
+class TestPreRank:
+    """Tests for local pre-ranking."""
+
+    def test_highest_score_first(self) -> None:
+        """Should rank authoritative, long items first."""
+        items = [
+            DigestItemInput(title="Low", url="https://example.com/a", content="short"),
+            DigestItemInput(title="High", url="https://openai.com/b", content="x" * 6000),
+        ]
+        assert [it.title for it in pre_rank(items, top_k=2)] == ["High", "Low"]
+
+    @pytest.mark.parametrize("top_k", [0, 1, 7, 50, 500])
+    def test_numpy_matches_python(self, top_k: int, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should select and order the same items with and without NumPy."""
+        pytest.importorskip("numpy")
+        items = make_items(200)
+        with_numpy = pre_rank(items, top_k=top_k)
+        monkeypatch.setattr(gad.digest, "HAS_NUMPY", False)
+        without_numpy = pre_rank(items, top_k=top_k)
+        assert [it.url for it in with_numpy] == [it.url for it in without_numpy]
+
+    def test_deferred_content_scored_by_characters(self, temp_data_dir: Path) -> None:
+        """Should score deferred multi-byte text like the same text loaded."""
+        text = "深度学习" * 400  # 1600 characters, 4800 bytes
+        content_file = temp_data_dir / "content.txt"
+        content_file.write_text(text, encoding="utf-8")
+
+        deferred = DigestItemInput.with_lazy_content(
+            content_file, len(text), title="T", url="https://example.com/a"
+        )
+        loaded = DigestItemInput(title="T", url="https://example.com/a", content=text)
+
+        assert deferred.content_pending
+        assert _content_length_score(deferred) == _content_length_score(loaded) == 3.0
+
+    def test_missing_content_falls_back_to_snippet(
+        self, temp_data_dir: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Should keep ranking when a deferred content file disappears."""
+        content_file = temp_data_dir / "content.txt"
+        content_file.write_text("Full article text", encoding="utf-8")
+        item = DigestItemInput.with_lazy_content(
+            content_file, 17, title="T", url="https://example.com/a", snippet="Snippet"
+        )
+        content_file.unlink()
+
+        [ranked] = pre_rank([item], top_k=1)
+
+        assert ranked.content is None
+        assert not ranked.content_pending
+        assert _content_length_score(ranked) == _content_length_score(
+            DigestItemInput(title="T", url="https://example.com/a", snippet="Snippet")
+        )
+        assert "Could not read content" in caplog.text
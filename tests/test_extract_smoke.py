@@ -1,12 +1,17 @@
 """Smoke tests for content extraction."""
 
 import pytest
+from bs4 import BeautifulSoup
 
+import gad.extract
 from gad.extract import (
     extract_content,
     extract_meta_info,
     extract_with_beautifulsoup,
+    extract_with_lxml,
+    extract_with_selectolax,
     normalize_whitespace,
+    parse_html,
 )
 
 
@@ -56,6 +61,26 @@ class TestExtractMetaInfo:
         _, _, published = extract_meta_info(sample_html)
         assert published == "2024-01-15"
 
+    def test_head_scan_matches_parsed(self, sample_html: str, sample_soup: BeautifulSoup) -> None:
+        """Should read the same metadata with and without a parsed document."""
+        assert extract_meta_info(sample_html) == extract_meta_info(sample_html, sample_soup)
+
+    def test_head_scan_attribute_order(self) -> None:
+        """Should read meta tags regardless of attribute order and quoting."""
+        html = (
+            "<html><head><title>Plain</title>"
+            "<meta content='Tom &amp; Jerry' property='og:title'>"
+            '<meta content="" property="article:author"><meta name=author content=Ann>'
+            "</head><body></body></html>"
+        )
+        assert extract_meta_info(html) == ("Tom & Jerry", "Ann", None)
+        assert extract_meta_info(html, parse_html(html)) == ("Tom & Jerry", "Ann", None)
+
+    def test_metadata_outside_head(self) -> None:
+        """Should find meta tags the parser places in the body."""
+        html = "<html><title>T</title><body><p>x</p><meta name=date content=D></body></html>"
+        assert extract_meta_info(html) == ("T", None, "D")
+
     def test_missing_metadata(self) -> None:
         """Should return None for missing metadata."""
         html = "<html><body><p>Content</p></body></html>"
@@ -104,6 +129,60 @@ class TestExtractWithBeautifulsoup:
         assert "console.log" not in text
         assert "color: red" not in text
 
+    def test_remove_embedded_fallbacks(self) -> None:
+        """Should drop noscript, template, iframe and svg text."""
+        html = (
+            "<body><p>Real content</p><noscript>Enable JavaScript</noscript>"
+            "<template>Hidden</template><iframe>No frames</iframe>"
+            "<svg><text>Icon</text></svg></body>"
+        )
+        assert extract_with_beautifulsoup(html) == "Real content"
+
+
+class TestExtractWithSelectolax:
+    """Tests for the selectolax fast path."""
+
+    def test_matches_beautifulsoup(self, sample_html: str) -> None:
+        """Should extract the same main content as the BeautifulSoup fallback."""
+        pytest.importorskip("selectolax")
+        text = extract_with_selectolax(sample_html)
+        assert text is not None
+        assert normalize_whitespace(text) == normalize_whitespace(
+            extract_with_beautifulsoup(sample_html)
+        )
+
+    def test_no_main_element(self) -> None:
+        """Should leave pages without a main-content element to other extractors."""
+        assert extract_with_selectolax("<html><body><p>Just text</p></body></html>") is None
+
+    def test_body_fallback(self) -> None:
+        """Should take the body text, without boilerplate, when asked to."""
+        pytest.importorskip("selectolax")
+        html = "<html><body><nav>Menu</nav><p>Just text</p></body></html>"
+        assert extract_with_selectolax(html, body_fallback=True) == "Just text"
+
+
+class TestExtractWithLxml:
+    """Tests for the lxml extractor."""
+
+    @pytest.mark.parametrize(
+        "html",
+        [
+            "<html><body><nav>Menu</nav>"
+            "<div class='a content'>Main <b>text</b></div></body></html>",
+            "<html><body><!-- note --><p>One</p><template>t</template>"
+            "<script>x</script>tail<p>Two &amp; three</p></body></html>",
+        ],
+    )
+    def test_matches_beautifulsoup(self, html: str) -> None:
+        """Should return the BeautifulSoup fallback's text, normalized."""
+        pytest.importorskip("lxml")
+        assert extract_with_lxml(html) == normalize_whitespace(extract_with_beautifulsoup(html))
+
+    def test_unparseable(self) -> None:
+        """Should leave documents lxml cannot parse to BeautifulSoup."""
+        assert extract_with_lxml("") is None
+
 
 class TestExtractContent:
     """Integration tests for content extraction."""
@@ -133,8 +212,26 @@ class TestExtractContent:
 
     def test_extract_empty_html(self) -> None:
         """Should handle empty HTML gracefully."""
-        result = extract_content("")
-        assert result.title == "Untitled"
+        for html in ("", " \n\t "):
+            result = extract_content(html)
+            assert result.title == "Untitled"
+            assert result.text == ""
+            assert result.word_count == 0
+
+    def test_word_count_matches_split(self) -> None:
+        """Should count words exactly as str.split() does."""
+        for body in ("one", "  one \t two\n\nthree\u00a0four ", " \n "):
+            result = extract_content(body, content_type="text/plain")
+            assert result.word_count == len(body.split())
+
+    def test_plain_text_skips_html_parsing(self) -> None:
+        """Should take text/plain bodies as text, markup included."""
+        result = extract_content("<b>not</b>   markup\n", content_type="text/plain")
+        assert result.text == "<b>not</b> markup"
+
+    def test_binary_content_type(self) -> None:
+        """Should extract nothing from non-text responses."""
+        result = extract_content("%PDF-1.7 binary", content_type="application/pdf")
         assert result.text == ""
         assert result.word_count == 0
 
@@ -143,3 +240,19 @@ class TestExtractContent:
         result = extract_content(sample_html, url="https://example.com/article")
         assert result.text
         # URL is used for context but doesn't change extraction
+
+    def test_repeat_extraction_cached(
+        self, sample_html: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Should return the cached result for a page extracted before."""
+        first = extract_content(sample_html, url="https://example.com/cached")
+        monkeypatch.setattr(gad.extract, "parse_html", None)
+        monkeypatch.setattr(gad.extract, "extract_with_selectolax", None)
+        second = extract_content(sample_html, url="https://example.com/cached")
+        assert second is first
+
+    def test_result_immutable(self, sample_html: str) -> None:
+        """Should not allow a shared result to be modified."""
+        result = extract_content(sample_html)
+        with pytest.raises(ValueError):
+            result.text = "changed"
@@ -0,0 +1,175 @@
+"""Tests for URL and feed fetching."""
+
+from typing import Callable
+
+import httpx
+import orjson
+import pytest
+
+import gad.config
+import gad.fetch
+from gad.config import Settings
+from gad.fetch import FetchError, is_feed_url, parse_feed
+
+FEED_URL = "https://example.com/feed.xml"
+
+# Installs a MockTransport handler and returns the requests it receives
+FeedServer = Callable[[Callable[[httpx.Request], httpx.Response]], list[httpx.Request]]
+
+
+def make_feed(count: int) -> bytes:
+    """Build an RSS feed with the given number of items."""
+    items = "".join(
+        f"<item><title>Post {i}</title><link>https://example.com/{i}</link></item>"
+        for i in range(count)
+    )
+    return (
+        f'<?xml version="1.0"?><rss version="2.0"><channel><title>Blog</title>'
+        f"{items}</channel></rss>"
+    ).encode()
+
+
+@pytest.fixture
+def feed_server(test_settings: Settings, monkeypatch: pytest.MonkeyPatch) -> FeedServer:
+    """Route the shared client through a MockTransport handler.
+
+    Returns a function that installs the handler and returns the list of
+    requests it receives.
+    """
+    monkeypatch.setattr(gad.config, "_settings", test_settings)
+    monkeypatch.setattr(gad.fetch, "_feed_cache", None)
+
+    def install(handler: Callable[[httpx.Request], httpx.Response]) -> list[httpx.Request]:
+        requests: list[httpx.Request] = []
+
+        def record(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return handler(request)
+
+        client = httpx.Client(transport=httpx.MockTransport(record))
+        monkeypatch.setattr(gad.fetch, "_client", client)
+        return requests
+
+    return install
+
+
+class TestIsFeedUrl:
+    """Tests for feed URL detection."""
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://example.com/feed",
+            "https://example.com/feeds/posts/default",
+            "https://example.com/blog/rss/",
+            "https://example.com/index.atom",
+            "https://example.com/index.xml",
+            "https://example.com/RSS.XML",
+        ],
+    )
+    def test_feed_urls(self, url: str) -> None:
+        """Should recognize common feed paths."""
+        assert is_feed_url(url)
+
+    @pytest.mark.parametrize(
+        "url",
+        ["https://example.com/post/hello", "https://example.com/?format=rss", "https://rss.example.com/"],
+    )
+    def test_article_urls(self, url: str) -> None:
+        """Should not flag ordinary article URLs."""
+        assert not is_feed_url(url)
+
+
+class TestParseFeedCache:
+    """Tests for the conditional-GET feed cache."""
+
+    def test_not_modified_reuses_cached_items(
+        self, feed_server: FeedServer, test_settings: Settings
+    ) -> None:
+        """Should send the stored validators and reuse items on a 304."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200,
+                content=make_feed(3),
+                headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+            )
+
+        requests = feed_server(handler)
+        first = parse_feed(FEED_URL)
+        second = parse_feed(FEED_URL)
+
+        assert [item.link for item in first] == [f"https://example.com/{i}" for i in range(3)]
+        assert second == first
+        assert "if-none-match" not in requests[0].headers
+        assert requests[1].headers["if-none-match"] == '"v1"'
+        assert requests[1].headers["if-modified-since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+
+    def test_validators_round_trip_through_file(
+        self, feed_server: FeedServer, test_settings: Settings, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Should persist validators in feeds.json and send them from a new process."""
+        requests = feed_server(
+            lambda request: httpx.Response(
+                200,
+                content=make_feed(2),
+                headers={"Last-Modified": "Tue, 02 Jan 2024 00:00:00 GMT"},
+            )
+        )
+        parse_feed(FEED_URL)
+
+        cache = orjson.loads((test_settings.cache_dir / "feeds.json").read_bytes())
+        assert cache[FEED_URL]["modified"] == "Tue, 02 Jan 2024 00:00:00 GMT"
+        assert cache[FEED_URL]["etag"] is None
+        assert len(cache[FEED_URL]["items"]) == 2
+
+        # A new process loads the cache from disk
+        monkeypatch.setattr(gad.fetch, "_feed_cache", None)
+        requests = feed_server(lambda request: httpx.Response(304))
+        items = parse_feed(FEED_URL)
+
+        assert requests[0].headers["if-modified-since"] == "Tue, 02 Jan 2024 00:00:00 GMT"
+        assert [item.title for item in items] == ["Post 0", "Post 1"]
+
+    def test_corrupt_cache_file_ignored(
+        self, feed_server: FeedServer, test_settings: Settings
+    ) -> None:
+        """Should fetch unconditionally and rewrite a corrupt feeds.json."""
+        cache_file = test_settings.cache_dir / "feeds.json"
+        cache_file.parent.mkdir(parents=True)
+        cache_file.write_bytes(b"{not json")
+        requests = feed_server(
+            lambda request: httpx.Response(200, content=make_feed(1), headers={"ETag": '"v1"'})
+        )
+
+        items = parse_feed(FEED_URL)
+
+        assert len(items) == 1
+        assert "if-none-match" not in requests[0].headers
+        assert orjson.loads(cache_file.read_bytes())[FEED_URL]["etag"] == '"v1"'
+
+    def test_limit_applies_to_cached_items(
+        self, feed_server: FeedServer, test_settings: Settings
+    ) -> None:
+        """Should cache every item but return at most limit, fresh or cached."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if "if-none-match" in request.headers:
+                return httpx.Response(304)
+            return httpx.Response(200, content=make_feed(5), headers={"ETag": '"v1"'})
+
+        feed_server(handler)
+
+        assert len(parse_feed(FEED_URL, limit=2)) == 2
+        cached = parse_feed(FEED_URL, limit=4)
+        assert [item.title for item in cached] == [f"Post {i}" for i in range(4)]
+        assert len(parse_feed(FEED_URL)) == 5
+
+    def test_http_error_raises(self, feed_server: FeedServer) -> None:
+        """Should raise FetchError when the feed request fails."""
+        feed_server(lambda request: httpx.Response(500))
+
+        with pytest.raises(FetchError):
+            parse_feed(FEED_URL)
@@ -0,0 +1,250 @@
+"""Tests for the staged ingestion pipeline."""
+
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.context import BaseContext
+from pathlib import Path
+from typing import Any, Optional
+
+import pytest
+
+import gad.config
+import gad.pipeline
+from gad.config import Settings
+from gad.dedup import load_seen_records, preload_seen
+from gad.fetch import FetchError
+from gad.models import FetchResult, IngestResult, SourceType
+from gad.pipeline import run_pipeline
+from gad.summarize import Summarizer
+
+
+def make_page(topic: str, words: int = 120) -> str:
+    """Build an article page with the given number of body words."""
+    body = " ".join(f"{topic}{i}" for i in range(words))
+    return (
+        f"<html><head><title>{topic} title</title></head>"
+        f"<body><article><p>{body}</p></article></body></html>"
+    )
+
+
+class MockSummarizer(Summarizer):
+    """Summarizer that fails for chosen titles."""
+
+    def __init__(self, fail_titles: tuple[str, ...] = ()) -> None:
+        self.model = "mock"
+        self.fail_titles = fail_titles
+        self.calls = 0
+
+    def summarize(self, text: str, title: Optional[str] = None) -> str:
+        self.calls += 1
+        if title in self.fail_titles:
+            raise RuntimeError("LLM unavailable")
+        return f"## TL;DR\n{title}"
+
+
+@pytest.fixture
+def pipeline_settings(temp_data_dir: Path, monkeypatch: pytest.MonkeyPatch) -> Settings:
+    """Settings for in-process pipeline runs, installed globally."""
+    settings = Settings(output_dir=temp_data_dir, extract_workers=1, llm_concurrency=1)
+    monkeypatch.setattr(gad.config, "_settings", settings)
+    return settings
+
+
+@pytest.fixture
+def pages(monkeypatch: pytest.MonkeyPatch) -> dict[str, str]:
+    """Pages served by a stubbed fetch_page_async; missing URLs fail to fetch."""
+    served: dict[str, str] = {}
+
+    async def fake_fetch(url: str) -> FetchResult:
+        if url not in served:
+            raise FetchError(f"HTTP 404 for {url}")
+        return FetchResult(text=served[url], content_type="text/html")
+
+    monkeypatch.setattr(gad.pipeline, "fetch_page_async", fake_fetch)
+    return served
+
+
+def run(
+    urls: list[str], settings: Settings, summarizer: Summarizer
+) -> dict[str, list[IngestResult]]:
+    """Run the pipeline and group the results by URL."""
+    jobs = [(url, SourceType.MANUAL) for url in urls]
+    results = asyncio.run(run_pipeline(jobs, ["test"], settings=settings, summarizer=summarizer))
+    assert len(results) == len(urls)
+    grouped: dict[str, list[IngestResult]] = {}
+    for result in results:
+        grouped.setdefault(result.url, []).append(result)
+    return grouped
+
+
+class TestRunPipeline:
+    """Tests for run_pipeline."""
+
+    def test_successful_article(self, pipeline_settings: Settings, pages: dict[str, str]) -> None:
+        """Should store the article and record it as seen."""
+        pages["https://example.com/a"] = make_page("alpha")
+
+        [result] = run(["https://example.com/a"], pipeline_settings, MockSummarizer())[
+            "https://example.com/a"
+        ]
+
+        assert result.success
+        assert result.title == "alpha title"
+        summary = Path(result.stored_path or "") / "summary.md"
+        assert summary.read_text(encoding="utf-8") == "## TL;DR\nalpha title"
+        assert len(load_seen_records(pipeline_settings.seen_file)) == 1
+
+    def test_fetch_error(self, pipeline_settings: Settings, pages: dict[str, str]) -> None:
+        """Should report fetch failures without storing anything."""
+        [result] = run(["https://example.com/missing"], pipeline_settings, MockSummarizer())[
+            "https://example.com/missing"
+        ]
+
+        assert not result.success
+        assert not result.skipped
+        assert "404" in (result.error or "")
+        assert not pipeline_settings.seen_file.exists()
+
+    def test_too_little_content(self, pipeline_settings: Settings, pages: dict[str, str]) -> None:
+        """Should reject pages with fewer than 50 words."""
+        pages["https://example.com/short"] = make_page("short", words=10)
+        summarizer = MockSummarizer()
+
+        [result] = run(["https://example.com/short"], pipeline_settings, summarizer)[
+            "https://example.com/short"
+        ]
+
+        assert not result.success
+        assert result.error == "Too little content extracted"
+        assert summarizer.calls == 0
+
+    def test_duplicates_in_one_run(
+        self, pipeline_settings: Settings, pages: dict[str, str]
+    ) -> None:
+        """Should ingest repeated URLs and repeated content once per run."""
+        pages["https://example.com/a"] = make_page("alpha")
+        pages["https://mirror.example.com/a"] = make_page("alpha")
+
+        results = run(
+            ["https://example.com/a", "https://example.com/a", "https://mirror.example.com/a"],
+            pipeline_settings,
+            MockSummarizer(),
+        )
+
+        flat = [r for group in results.values() for r in group]
+        assert sum(r.success for r in flat) == 1
+        assert sum(r.skipped for r in flat) == 2
+        assert len(load_seen_records(pipeline_settings.seen_file)) == 1
+
+    def test_summarizer_error(self, pipeline_settings: Settings, pages: dict[str, str]) -> None:
+        """Should report summarizer failures and store nothing for them."""
+        pages["https://example.com/a"] = make_page("alpha")
+        pages["https://example.com/b"] = make_page("beta")
+
+        results = run(
+            ["https://example.com/a", "https://example.com/b"],
+            pipeline_settings,
+            MockSummarizer(fail_titles=("alpha title",)),
+        )
+
+        [failed] = results["https://example.com/a"]
+        assert not failed.success
+        assert failed.error == "LLM unavailable"
+        assert results["https://example.com/b"][0].success
+        assert len(load_seen_records(pipeline_settings.seen_file)) == 1
+
+    def test_failed_copy_releases_claim(
+        self, pipeline_settings: Settings, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Should ingest a later copy when the copy that claimed it fails."""
+        first_failed = asyncio.Event()
+        fetches = 0
+
+        async def fake_fetch(url: str) -> FetchResult:
+            nonlocal fetches
+            fetches += 1
+            if fetches > 1:
+                # Hold the second copy back until the first has failed
+                await first_failed.wait()
+            return FetchResult(text=make_page("alpha"), content_type="text/html")
+
+        class FailOnceSummarizer(MockSummarizer):
+            async def summarize_async(self, text: str, title: Optional[str] = None) -> str:
+                if not first_failed.is_set():
+                    first_failed.set()
+                    raise RuntimeError("LLM unavailable")
+                return self.summarize(text, title)
+
+        monkeypatch.setattr(gad.pipeline, "fetch_page_async", fake_fetch)
+
+        results = run(
+            ["https://example.com/a", "https://example.com/a"],
+            pipeline_settings,
+            FailOnceSummarizer(),
+        )["https://example.com/a"]
+
+        assert sorted((r.success, r.skipped) for r in results) == [(False, False), (True, False)]
+        assert len(load_seen_records(pipeline_settings.seen_file)) == 1
+
+    def test_small_run_extracts_in_process(
+        self, pipeline_settings: Settings, pages: dict[str, str], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Should not start worker processes for fewer pages than pay off."""
+        pages["https://example.com/a"] = make_page("alpha")
+        settings = pipeline_settings.model_copy(update={"extract_workers": 8})
+
+        def no_pool(*args: object, **kwargs: object) -> None:
+            raise AssertionError("process pool started")
+
+        monkeypatch.setattr(gad.pipeline, "ProcessPoolExecutor", no_pool)
+
+        [result] = run(["https://example.com/a"], settings, MockSummarizer())[
+            "https://example.com/a"
+        ]
+        assert result.success
+
+    def test_large_run_uses_worker_processes(
+        self, pipeline_settings: Settings, pages: dict[str, str], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Should extract in worker processes that are not forked from the loop."""
+        urls = [f"https://example.com/{i}" for i in range(4)]
+        for i, url in enumerate(urls):
+            pages[url] = make_page(f"topic{i}x")
+        settings = pipeline_settings.model_copy(update={"extract_workers": 2})
+        contexts: list[object] = []
+
+        def recording_pool(*args: Any, **kwargs: Any) -> ProcessPoolExecutor:
+            contexts.append(kwargs.get("mp_context"))
+            return ProcessPoolExecutor(*args, **kwargs)
+
+        monkeypatch.setattr(gad.pipeline, "ProcessPoolExecutor", recording_pool)
+
+        results = run(urls, settings, MockSummarizer())
+
+        assert all(group[0].success for group in results.values())
+        [context] = contexts
+        assert isinstance(context, BaseContext)
+        assert context.get_start_method() != "fork"
+
+    def test_seen_index_loaded_off_loop(
+        self, pipeline_settings: Settings, pages: dict[str, str], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Should build the seen index on a worker thread before duplicate checks."""
+        pages["https://example.com/a"] = make_page("alpha")
+        threads: list[int] = []
+
+        def recording_preload(seen_file: Path) -> None:
+            threads.append(threading.get_ident())
+            preload_seen(seen_file)
+
+        monkeypatch.setattr(gad.pipeline, "preload_seen", recording_preload)
+
+        run(["https://example.com/a"], pipeline_settings, MockSummarizer())
+        [result] = run(["https://example.com/a"], pipeline_settings, MockSummarizer())[
+            "https://example.com/a"
+        ]
+
+        assert result.skipped
+        assert len(threads) == 2
+        assert threading.get_ident() not in threads
@@ -0,0 +1,159 @@
+"""Tests for output rendering."""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import gad.render
+from gad.models import ArticleMeta, SourceType
+from gad.render import (
+    _extract_tldr,
+    get_article_path,
+    load_articles_for_date,
+    migrate_library_layout,
+    slugify,
+    write_article,
+)
+
+
+def make_meta(
+    title: str = "Café Notes", fetched_at: datetime = datetime(2024, 1, 2, 3, 4, 5)
+) -> ArticleMeta:
+    """Build article metadata for render tests."""
+    return ArticleMeta(
+        title=title,
+        url="https://example.com/post",
+        url_hash="a" * 64,
+        content_hash="b" * 64,
+        fetched_at=fetched_at,
+        word_count=3,
+        tags=["test"],
+        source=SourceType.MANUAL,
+    )
+
+
+class TestSlugify:
+    """Tests for slug generation."""
+
+    @pytest.mark.parametrize(
+        "title,expected",
+        [
+            ("Hello World", "hello-world"),
+            ("GPT-4o: What's NEW in 2024? (part 2)", "gpt-4o-what-s-new-in-2024-part-2"),
+            ("  --Leading and trailing--  ", "leading-and-trailing"),
+            ("Café déjà vu", "cafe-deja-vu"),
+        ],
+    )
+    def test_slug(self, title: str, expected: str) -> None:
+        """Should lowercase, transliterate and hyphenate titles."""
+        assert slugify(title) == expected
+
+    def test_no_ascii_characters(self) -> None:
+        """Should fall back to a placeholder when nothing is left."""
+        assert slugify("日本語") == "untitled"
+
+    def test_truncates_at_word_boundary(self) -> None:
+        """Should cut long slugs at a hyphen within max_length."""
+        assert slugify("alpha beta gamma delta", max_length=12) == "alpha-beta"
+
+
+class TestExtractTldr:
+    """Tests for reading the TL;DR section of a summary."""
+
+    def test_section_text(self, temp_data_dir: Path) -> None:
+        """Should return the text between the TL;DR heading and the next section."""
+        summary_file = temp_data_dir / "summary.md"
+        summary_file.write_text(
+            "# Title\n\n## TL;DR\nFirst line.\nSecond line.\n\n## Problem\nMore.\n",
+            encoding="utf-8",
+        )
+        assert _extract_tldr(summary_file) == "First line.\nSecond line."
+
+    def test_section_ends_at_rule(self, temp_data_dir: Path) -> None:
+        """Should stop at a horizontal rule."""
+        summary_file = temp_data_dir / "summary.md"
+        summary_file.write_text("## TL;DR\nShort.\n---\n*Footer*", encoding="utf-8")
+        assert _extract_tldr(summary_file) == "Short."
+
+    def test_missing(self, temp_data_dir: Path) -> None:
+        """Should return None without a file or section."""
+        summary_file = temp_data_dir / "summary.md"
+        assert _extract_tldr(summary_file) is None
+        summary_file.write_text("## Problem\nText\n", encoding="utf-8")
+        assert _extract_tldr(summary_file) is None
+
+
+class TestWriteArticle:
+    """Tests for writing and loading library articles."""
+
+    def test_round_trip(self, temp_data_dir: Path) -> None:
+        """Should load back the metadata and files that were written."""
+        meta = make_meta()
+        article_dir = write_article(meta, "Body text", "## TL;DR\nShort", temp_data_dir)
+
+        assert (article_dir / "content.txt").read_text(encoding="utf-8") == "Body text"
+        assert (article_dir / "summary.md").read_text(encoding="utf-8") == "## TL;DR\nShort"
+        assert load_articles_for_date(meta.fetched_at, temp_data_dir) == [(meta, article_dir)]
+
+    def test_day_directory(self, temp_data_dir: Path) -> None:
+        """Should store articles under year, month and day."""
+        path = get_article_path("Hello", datetime(2024, 1, 2, 3, 4, 5), temp_data_dir)
+        assert path == temp_data_dir / "2024" / "01" / "02" / "hello-030405"
+
+    def test_other_days_not_loaded(self, temp_data_dir: Path) -> None:
+        """Should only return articles fetched on the requested date."""
+        write_article(make_meta(fetched_at=datetime(2024, 1, 3, 9, 0, 0)), "x", "y", temp_data_dir)
+        assert load_articles_for_date(datetime(2024, 1, 2), temp_data_dir) == []
+
+    def test_many_articles(self, temp_data_dir: Path) -> None:
+        """Should load every article when meta.json files are read in parallel."""
+        titles = {f"Post {i}" for i in range(40)}
+        for i, title in enumerate(sorted(titles)):
+            meta = make_meta(title=title, fetched_at=datetime(2024, 1, 2, 3, 4, i % 60))
+            write_article(meta, "x", "y", temp_data_dir)
+
+        loaded = load_articles_for_date(datetime(2024, 1, 2), temp_data_dir)
+        assert {meta.title for meta, _ in loaded} == titles
+
+    def test_failed_write_leaves_nothing(
+        self, temp_data_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Should leave neither the article nor its staging directory after a failed write."""
+        real_open = open
+
+        def failing_open(file: Path, *args: Any, **kwargs: Any) -> Any:
+            if Path(file).name == "summary.md":
+                raise OSError("disk full")
+            return real_open(file, *args, **kwargs)
+
+        monkeypatch.setattr(gad.render, "open", failing_open, raising=False)
+        meta = make_meta()
+
+        with pytest.raises(OSError, match="disk full"):
+            write_article(meta, "Body text", "## TL;DR\nShort", temp_data_dir)
+
+        day_dir = get_article_path(meta.title, meta.fetched_at, temp_data_dir).parent
+        assert list(day_dir.iterdir()) == []
+        assert load_articles_for_date(meta.fetched_at, temp_data_dir) == []
+
+
+class TestMigrateLibraryLayout:
+    """Tests for moving articles into per-day directories."""
+
+    def test_moves_legacy_articles(self, temp_data_dir: Path) -> None:
+        """Should move month-level articles into their day and keep them loadable."""
+        meta = make_meta()
+        article_dir = write_article(meta, "Body", "Summary", temp_data_dir)
+        legacy_dir = article_dir.parent.parent / article_dir.name
+        article_dir.rename(legacy_dir)
+        article_dir.parent.rmdir()
+
+        # Legacy articles are still found before migrating
+        assert load_articles_for_date(meta.fetched_at, temp_data_dir) == [(meta, legacy_dir)]
+
+        assert migrate_library_layout(temp_data_dir) == 1
+        assert not legacy_dir.exists()
+        assert load_articles_for_date(meta.fetched_at, temp_data_dir) == [(meta, article_dir)]
+        assert migrate_library_layout(temp_data_dir) == 0
@@ -0,0 +1,69 @@
+"""Tests for summarization helpers."""
+
+import asyncio
+from typing import Optional
+
+import pytest
+
+import gad.config
+from gad.config import Settings
+from gad.summarize import (
+    Summarizer,
+    cached_summarize,
+    cached_summarize_async,
+)
+
+
+class CountingSummarizer(Summarizer):
+    """Summarizer that records how often it is called."""
+
+    def __init__(self, model: str = "test-model") -> None:
+        self.model = model
+        self.calls = 0
+
+    def summarize(self, text: str, title: Optional[str] = None) -> str:
+        self.calls += 1
+        return f"# Summary: {title}\n\n{text[:20]}"
+
+
+@pytest.fixture
+def active_settings(test_settings: Settings, monkeypatch: pytest.MonkeyPatch) -> Settings:
+    """Install test settings as the global settings instance."""
+    monkeypatch.setattr(gad.config, "_settings", test_settings)
+    return test_settings
+
+
+class TestCachedSummarize:
+    """Tests for the on-disk summary cache."""
+
+    def test_cache_hit_skips_summarizer(self, active_settings: Settings) -> None:
+        """Should call the summarizer once for repeated content."""
+        summarizer = CountingSummarizer()
+        first = cached_summarize(summarizer, "Some article text", "Title", "hash1")
+        second = cached_summarize(summarizer, "Some article text", "Title", "hash1")
+        assert first == second
+        assert summarizer.calls == 1
+
+    def test_different_content_misses(self, active_settings: Settings) -> None:
+        """Should not reuse a summary for different content."""
+        summarizer = CountingSummarizer()
+        cached_summarize(summarizer, "Some article text", "Title", "hash1")
+        cached_summarize(summarizer, "Other article text", "Title", "hash2")
+        assert summarizer.calls == 2
+
+    def test_different_model_misses(self, active_settings: Settings) -> None:
+        """Should not reuse a summary produced by another model."""
+        cached_summarize(CountingSummarizer("model-a"), "Text", "Title", "hash1")
+        other = CountingSummarizer("model-b")
+        cached_summarize(other, "Text", "Title", "hash1")
+        assert other.calls == 1
+
+    def test_async_shares_cache(self, active_settings: Settings) -> None:
+        """Should reuse summaries written by the sync path."""
+        summarizer = CountingSummarizer()
+        first = cached_summarize(summarizer, "Some article text", "Title", "hash1")
+        second = asyncio.run(
+            cached_summarize_async(summarizer, "Some article text", "Title", "hash1")
+        )
+        assert first == second
+        assert summarizer.calls == 1